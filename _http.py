@@ -0,0 +1,72 @@
+"""HTTP plumbing shared by the synthesize and transcribe CLIs."""
+import atexit
+import functools
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import InvalidHeader
+from urllib3.util.retry import RequestHistory, Retry
+
+# orjson parses large JSON bodies (e.g. accounts with many voices) several times
+# faster than the stdlib; both accept the raw response bytes.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+# Rate limits and transient 5xx are retried with capped exponential backoff
+# (honoring Retry-After); other errors such as 401 fail fast. The final
+# response is returned rather than raised so callers can report its body.
+RETRY = Retry(
+    total=4,
+    backoff_factor=1,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(['POST', 'GET']),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+
+def retry_wait(method: str, status: int, retry_after: str = None, attempt: int = 0):
+    """Return seconds to sleep before retrying a `status` response under RETRY, or None to give up.
+
+    For clients outside the requests session (aiohttp, httpx) that must loop
+    themselves; `attempt` counts the retries already made. Like urllib3, a
+    Retry-After header wins over the exponential backoff.
+    """
+    if attempt >= RETRY.total or not RETRY.is_retry(method, status, bool(retry_after)):
+        return None
+    if retry_after and RETRY.respect_retry_after_header:
+        try:
+            return RETRY.parse_retry_after(retry_after)
+        except InvalidHeader:
+            pass
+    history = (RequestHistory(method, None, None, status, None),) * (attempt + 1)
+    return RETRY.new(history=history).get_backoff_time()
+
+
+def get_session(retries: bool = True) -> requests.Session:
+    """Return the process-wide keep-alive session for Eleven Labs API calls.
+
+    Every module that talks to the API shares one pool of warm TLS connections, so
+    a pipeline that both transcribes and synthesizes does not handshake twice.
+    `retries=False` gives a session over that same pool without the RETRY policy,
+    for callers that retry at a higher level (e.g. tenacity around transcribe_file)
+    and would otherwise multiply attempts.
+    """
+    # normalized so get_session() and get_session(retries=True) hit one cache entry
+    return _session(bool(retries))
+
+
+@functools.lru_cache(maxsize=2)
+def _session(retries: bool) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=RETRY if retries else 0)
+    if not retries:
+        # retries are applied per request by the adapter, so the pool itself can be shared
+        adapter.poolmanager = _session(True).get_adapter('https://').poolmanager
+    session.mount('https://', adapter)
+    atexit.register(session.close)
+    return session
@@ -4,11 +4,15 @@ This script shows how to call the existing function with an exponential
 backoff retry. It does not include your API key; set `ELEVENLABS_API_KEY`
 via environment or `.env` (see README).
 """
+import io
 import os
+import shutil
+import subprocess
 import sys
-import tempfile
-from typing import Optional
+import wave
+from typing import BinaryIO, Optional, Union
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
 
 try:
@@ -17,104 +21,142 @@ try:
 except Exception:
     pass
 
+import requests
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-from transcribe import transcribe_file, DEFAULT_ENDPOINT
+from transcribe import transcribe_file, DEFAULT_ENDPOINT, RetriableHTTPError
 
 
-def _ensure_wav_mono_16k(path: str) -> str:
-    """Ensure audio is WAV, mono, 16 kHz. Returns path to converted file (may be original).
+def _is_wav_mono_16k(path: str) -> bool:
+    """Return True if `path` is a PCM WAV file that is already mono 16 kHz."""
+    if not path.lower().endswith(".wav"):
+        return False
+    try:
+        with wave.open(path, "rb") as w:
+            return w.getnchannels() == 1 and w.getframerate() == 16000
+    except (wave.Error, EOFError, OSError):
+        return False
+
 
-    Uses pydub if available; otherwise returns the original path and prints a warning.
+def _ensure_wav_mono_16k(path: str) -> Union[str, BinaryIO]:
+    """Ensure audio is WAV, mono, 16 kHz. Returns the original path or an in-memory WAV.
+
+    Files that already match are returned as-is without a decode/encode cycle.
+    Otherwise a single ffmpeg process decodes, downmixes and resamples straight to
+    stdout, and the result is uploaded from a ``BytesIO``. If ffmpeg is missing,
+    returns the original path and prints a warning.
     """
-    try:
-        from pydub import AudioSegment  # type: ignore
-    except Exception:
-        print("pydub not installed; sending original file as-is. Install pydub+ffmpeg for conversion.")
+    if _is_wav_mono_16k(path):
         return path
 
-    # Load and convert
-    audio = AudioSegment.from_file(path)
-    audio = audio.set_channels(1)
-    audio = audio.set_frame_rate(16000)
+    ffmpeg = shutil.which("ffmpeg")
+    if not ffmpeg:
+        print("ffmpeg not found; sending original file as-is. Install ffmpeg for conversion.")
+        return path
+
+    proc = subprocess.run(
+        [ffmpeg, "-hide_banner", "-loglevel", "error", "-i", path,
+         "-ac", "1", "-ar", "16000", "-f", "wav", "pipe:1"],
+        capture_output=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed to convert {path}: {proc.stderr.decode(errors='replace').strip()}")
+
+    buf = io.BytesIO(proc.stdout)
+    # upload filename for the multipart form
+    buf.name = os.path.splitext(os.path.basename(path))[0] + ".wav"
+    return buf
 
-    fd, tmp = tempfile.mkstemp(suffix=".wav")
-    os.close(fd)
-    audio.export(tmp, format="wav")
-    return tmp
 
+# longest single wait between attempts, whether from backoff or a Retry-After hint
+_MAX_WAIT = 16
+_backoff = wait_exponential(multiplier=1, min=1, max=_MAX_WAIT)
 
-@retry(stop=stop_after_attempt(4), wait=wait_exponential(multiplier=1, min=1, max=16),
-       retry=retry_if_exception_type(Exception))
-def retry_transcribe(path: str, api_key: str, endpoint: str = DEFAULT_ENDPOINT) -> dict:
-    print(f"Uploading {path}...")
-    return transcribe_file(path, api_key, endpoint)
+
+def _wait_retry_after(retry_state) -> float:
+    """Sleep for the server's Retry-After hint (capped) when given, else capped exponential backoff."""
+    retry_after = getattr(retry_state.outcome.exception(), "retry_after", None)
+    if retry_after is not None:
+        return min(retry_after, _MAX_WAIT)
+    return _backoff(retry_state)
+
+
+# Only network failures, rate limits and transient 5xx are retried; auth and
+# validation errors fail fast instead of sleeping through the backoff window.
+@retry(stop=stop_after_attempt(4), wait=_wait_retry_after,
+       retry=retry_if_exception_type((requests.ConnectionError, requests.Timeout, RetriableHTTPError)),
+       reraise=True)
+def retry_transcribe(audio: Union[str, BinaryIO], api_key: str, endpoint: str = DEFAULT_ENDPOINT) -> dict:
+    print(f"Uploading {getattr(audio, 'name', audio)}...")
+    return transcribe_file(audio, api_key, endpoint)
+
+
+def _transcribe_one(path: str, convert: bool, api_key: str, endpoint: str) -> dict:
+    audio = _ensure_wav_mono_16k(path) if convert else path
+    return retry_transcribe(audio, api_key, endpoint)
+
+
+def _print_result(result) -> None:
+    if isinstance(result, dict) and "text" in result:
+        print("Transcription:\n", result["text"])
+    else:
+        import json
+        print(json.dumps(result, indent=2, ensure_ascii=False))
 
 
 def main():
-    parser = argparse.ArgumentParser(description="Integration example: transcribe an audio file with optional conversion")
-    parser.add_argument("path", help="Path to audio file")
+    parser = argparse.ArgumentParser(description="Integration example: transcribe audio files with optional conversion")
+    parser.add_argument("paths", nargs="+", metavar="path", help="Path(s) to audio file(s)")
     parser.add_argument("--endpoint", default=DEFAULT_ENDPOINT, help="Override the STT endpoint URL")
     parser.add_argument("--model", help="Model identifier to pass to the STT endpoint (appended as query param 'model')")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="Number of files to transcribe concurrently (default: 1)")
     group = parser.add_mutually_exclusive_group()
-    group.add_argument("--convert", dest="convert", action="store_true", help="Force convert audio to WAV mono 16k (requires pydub+ffmpeg)")
+    group.add_argument("--convert", dest="convert", action="store_true", help="Force convert audio to WAV mono 16k (requires ffmpeg)")
     group.add_argument("--no-convert", dest="convert", action="store_false", help="Skip audio conversion and send file as-is")
     parser.set_defaults(convert=None)
     args = parser.parse_args()
 
-    path = args.path
     api_key = os.environ.get("ELEVENLABS_API_KEY")
     if not api_key:
         print("Set ELEVENLABS_API_KEY in your environment or in a local .env file before running.")
         sys.exit(2)
 
-    converted = None
-    try:
-        # Decide whether to convert: None => auto (convert if pydub installed), True => force, False => skip
-        if args.convert is False:
-            converted = path
-        else:
-            # args.convert is True (force) or None (auto)
-            try:
-                # check pydub availability
-                import pydub  # type: ignore
-                need_convert = True if args.convert is True or args.convert is None else False
-            except Exception:
-                need_convert = False
-            if need_convert:
-                converted = _ensure_wav_mono_16k(path)
-                if converted == path and args.convert is True:
-                    # user requested conversion but conversion wasn't possible
-                    print("Conversion requested but pydub/ffmpeg not available. Install pydub and ffmpeg or run without --convert.")
-                    sys.exit(2)
-            else:
-                converted = path
-
-        # If a model was provided, append it to the endpoint query string safely
-        endpoint = args.endpoint
-        if args.model:
-            parts = urlparse(endpoint)
-            qs = dict(parse_qsl(parts.query))
-            qs["model"] = args.model
-            parts = parts._replace(query=urlencode(qs))
-            endpoint = urlunparse(parts)
-
-        result = retry_transcribe(converted, api_key, endpoint)
-    except Exception as exc:
-        print(f"Transcription failed: {exc}")
+    # Decide whether to convert: None => auto (convert if ffmpeg installed), True => force, False => skip
+    need_convert = args.convert is not False and shutil.which("ffmpeg") is not None
+    if args.convert is True and not need_convert:
+        # user requested conversion but conversion isn't possible
+        print("Conversion requested but ffmpeg not available. Install ffmpeg or run without --convert.")
+        sys.exit(2)
+
+    # If a model was provided, append it to the endpoint query string safely
+    endpoint = args.endpoint
+    if args.model:
+        parts = urlparse(endpoint)
+        qs = dict(parse_qsl(parts.query))
+        qs["model"] = args.model
+        parts = parts._replace(query=urlencode(qs))
+        endpoint = urlunparse(parts)
+
+    # Uploads are network-bound, so a thread per in-flight file scales well up to
+    # the server's rate limit (429s are retried with backoff by retry_transcribe).
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+        futures = [
+            (path, executor.submit(_transcribe_one, path, need_convert, api_key, endpoint))
+            for path in args.paths
+        ]
+
+    failed = False
+    for path, future in futures:
+        if len(futures) > 1:
+            print(f"== {path}")
+        try:
+            result = future.result()
+        except Exception as exc:
+            print(f"Transcription failed: {exc}")
+            failed = True
+            continue
+        _print_result(result)
+    if failed:
         sys.exit(1)
-    finally:
-        if converted and converted != path:
-            try:
-                os.remove(converted)
-            except Exception:
-                pass
-
-    # print useful output
-    if isinstance(result, dict) and "text" in result:
-        print("Transcription:\n", result["text"])
-    else:
-        import json
-        print(json.dumps(result, indent=2, ensure_ascii=False))
 
 
 if __name__ == "__main__":
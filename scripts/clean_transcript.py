@@ -7,49 +7,105 @@ Usage:
 Behavior:
 - Removes bracketed cues like "[on hold music]"
 - Removes common filler tokens when isolated
-- Collapses consecutive duplicate sentences
+- Drops repeated sentences (case-insensitive), keeping the first occurrence
 - Normalizes whitespace
 """
+import mmap
+import os
 import re
+import stat
 import sys
 
 
-FILLERS_RE = re.compile(r"\b(uh|um|you know|yeah|okay|right|I mean)\b", flags=re.I)
-BRACKET_RE = re.compile(r"\[.*?\]", flags=re.S)
+# Fillers are dropped per token (phrases as consecutive token pairs) so their
+# trailing punctuation is handled the same way for both.
+FILLERS = frozenset({'uh', 'um', 'yeah', 'okay', 'right'})
+PHRASE_FILLERS = frozenset({('you', 'know'), ('i', 'mean')})
+# Bracketed cues and whitespace runs in one alternation so the text is scanned
+# once. Cues swallow trailing whitespace so their removal does not leave double
+# spaces behind.
+MASTER_RE = re.compile(r"(\[.*?\]\s*)|\s+", flags=re.S)
 SENT_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
 
 
+def _master_sub(m: re.Match) -> str:
+    # cues are dropped, any other whitespace run becomes one space
+    return '' if m.lastindex else ' '
+
+
 def normalize_sentence(s: str) -> str:
-    s = s.strip()
-    s = FILLERS_RE.sub('', s)
-    s = re.sub(r"\s+", ' ', s)
-    return s.strip()
+    words = s.split()
+    out = []
+    i = 0
+    while i < len(words):
+        w = words[i]
+        core = w.rstrip(',.!?')
+        if core.lower() in FILLERS:
+            last = i
+        elif (w == core and i + 1 < len(words)
+              and (core.lower(), words[i + 1].rstrip(',.!?').lower()) in PHRASE_FILLERS):
+            last = i + 1
+        else:
+            out.append(w)
+            i += 1
+            continue
+        # drop the filler but keep sentence-ending punctuation on the previous word
+        end = words[last]
+        tail = end[len(end.rstrip(',.!?')):].lstrip(',')
+        if tail and out:
+            out[-1] = out[-1].rstrip(',') + tail
+        i = last + 1
+    return ' '.join(out)
+
+
+def iter_sentences(text: str):
+    """Yield sentences lazily from boundary matches instead of materializing a split list."""
+    start = 0
+    for m in SENT_SPLIT_RE.finditer(text):
+        yield text[start:m.start()]
+        start = m.end()
+    yield text[start:]
 
 
 def clean_text(text: str) -> str:
-    # remove bracketed cues
-    text = BRACKET_RE.sub('', text)
-    # normalize line breaks to spaces
-    text = text.replace('\n', ' ')
-    text = re.sub(r"\s+", ' ', text).strip()
-
-    # split into sentences, collapse consecutive duplicates
-    sentences = SENT_SPLIT_RE.split(text)
+    # remove bracketed cues, collapse whitespace (including line breaks)
+    text = MASTER_RE.sub(_master_sub, text).strip()
+
+    # split into sentences, drop any sentence already seen (ASR often repeats
+    # phrases non-consecutively); only hashes are kept to bound memory
     out = []
-    prev_norm = None
-    for s in sentences:
+    seen = set()
+    for s in iter_sentences(text):
         norm = normalize_sentence(s)
         if not norm:
             continue
-        # skip exact consecutive duplicates
-        if prev_norm is not None and norm.lower() == prev_norm.lower():
+        key = hash(norm.lower())
+        if key in seen:
             continue
+        seen.add(key)
+        # capitalize the first letter only; str.capitalize would lowercase the rest
+        if not norm[0].isupper():
+            norm = norm[0].upper() + norm[1:]
         out.append(norm)
-        prev_norm = norm
 
-    # Capitalize sentences, join with single space
-    cleaned = ' '.join(s[0].upper() + s[1:] if s and not s[0].isupper() else s for s in out)
-    return cleaned
+    return ' '.join(out)
+
+
+def read_text(path: str) -> str:
+    """Decode a UTF-8 file, straight from an mmap when it is a non-empty regular file.
+
+    Pipes, FIFOs and files reporting a size of 0 (e.g. under /proc) cannot be
+    mapped meaningfully, so those are read normally.
+    """
+    with open(path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        if stat.S_ISREG(st.st_mode) and st.st_size > 0:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return str(mm, 'utf-8')
+            except (OSError, ValueError):
+                pass
+        return f.read().decode('utf-8')
 
 
 def main(argv):
@@ -57,8 +113,7 @@ def main(argv):
         print('Usage: clean_transcript.py input.txt output.cleaned.txt')
         return 2
     inp, outp = argv[1], argv[2]
-    with open(inp, 'r', encoding='utf-8') as f:
-        text = f.read()
+    text = read_text(inp)
     cleaned = clean_text(text)
     with open(outp, 'w', encoding='utf-8') as f:
         f.write(cleaned)
@@ -14,23 +14,76 @@ Notes:
 - The `--voice` argument should be a valid voice id from your Eleven Labs account.
 """
 import argparse
+import asyncio
+import atexit
+import contextlib
+import functools
+import hashlib
+import inspect
 import os
 import re
+import shutil
+import stat
+import string
 import sys
+import tempfile
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-try:
-    import elevenlabs as _eleven_sdk  # optional SDK
-    HAS_SDK = True
-except Exception:
-    _eleven_sdk = None
-    HAS_SDK = False
+from _http import _loads, get_session, retry_wait
+
+# The optional SDK pulls in httpx/pydantic and is slow to import, so it is loaded
+# on first use. HAS_SDK stays None until the import has been attempted; tests may
+# preset `_eleven_sdk` and HAS_SDK directly.
+_eleven_sdk = None
+HAS_SDK = None
+
+
+def _get_sdk():
+    """Return the elevenlabs SDK module, importing it on first call, or None if unavailable."""
+    global _eleven_sdk, HAS_SDK
+    if HAS_SDK is None:
+        try:
+            import elevenlabs  # optional SDK
+            _eleven_sdk, HAS_SDK = elevenlabs, True
+        except Exception:
+            _eleven_sdk, HAS_SDK = None, False
+    return _eleven_sdk if HAS_SDK else None
 
 
 API_KEY_RE = re.compile(r"^sk_[A-Za-z0-9_-]{8,}$")
+# raw.read(n) blocks until n bytes arrive, so keep this modest: large enough to
+# amortize per-call overhead, small enough that bytes hit disk as they stream in
+_COPY_BUFSIZE = 64 * 1024
+_MIME_MAP = {
+    'mp3': 'audio/mpeg',
+    'wav': 'audio/wav',
+    'ogg': 'audio/ogg',
+}
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+# deletes every ASCII char outside a-z0-9; used for the common all-ASCII label case
+_LABEL_TRANS = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if c not in string.ascii_lowercase + string.digits))
+_SEP_RUN_RE = re.compile(r"[_\-.]+")
+# voice args that look like raw ids rather than friendly display names
+_ID_LIKE_RE = re.compile(r"^[A-Za-z0-9_-]{6,}$")
+# canonical Eleven Labs voice ids, e.g. 21m00Tcm4TlvDq8ikWAM
+_VOICE_ID_RE = re.compile(r"[A-Za-z0-9]{20,}")
+# characters a --batch id may not contain, since ids are spliced into output filenames
+_PATH_SEPS = ('/', os.sep, os.altsep)
 env_var_name = 'ELEVEN' + 'LABS_API_KEY'
 
+# `--output -` streams audio to stdout for pipelines (e.g. `| ffplay -`)
+STDOUT = Path('-')
+# Synthesized audio is cached by request so repeated phrases skip the paid API call.
+DEFAULT_CACHE_DIR = Path('~/.cache/eleven').expanduser()
+
+# One keep-alive session per process (shared with transcribe.py) so voice listing
+# and synthesis reuse warm TCP/TLS connections instead of handshaking per call.
+_SESSION = get_session()
+
 
 def fail(msg: str, code: int = 1):
     print(msg, file=sys.stderr)
@@ -48,51 +101,481 @@ def load_text(args):
     fail('No input text provided. Use --text or --infile')
 
 
+@functools.lru_cache(maxsize=4)
 def validate_key(key: str):
     if not key:
         return False
     return bool(API_KEY_RE.match(key))
 
 
-def synthesize_via_http(text: str, api_key: str, voice: str, endpoint: str, out_path: Path, fmt: str = 'mp3'):
+# SDK introspection is resolved once and cached per SDK module (so a swapped-in
+# module, e.g. a test fake, gets its own entry) rather than re-walked per call.
+@functools.lru_cache(maxsize=None)
+def _resolve_sdk(sdk):
+    """Return the SDK's client class, or None if it exposes none we recognize."""
+    return getattr(sdk, 'Client', None) or getattr(sdk, 'ElevenLabsClient', None)
+
+
+@functools.lru_cache(maxsize=4)
+def _sdk_client(sdk, api_key: str):
+    Client = _resolve_sdk(sdk)
+    return Client(api_key=api_key) if Client else None
+
+
+def _accepts_kwarg(fn, name: str) -> bool:
+    try:
+        params = inspect.signature(fn).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(p.name == name or p.kind is inspect.Parameter.VAR_KEYWORD for p in params)
+
+
+@functools.lru_cache(maxsize=4)
+def _sdk_tts(sdk, api_key: str):
+    """Return the SDK's text-to-speech call as `synth(text=, voice=, format=)`, or None.
+
+    For SDK methods without a `format` parameter the argument is dropped here,
+    once, instead of being probed with a failing call on every synthesis.
+    """
+    client = _sdk_client(sdk, api_key)
+    tts = client and (getattr(client, 'text_to_speech', None) or getattr(client, 'tts', None))
+    if not tts:
+        return None
+    for meth in ('synthesize', 'speak', 'generate'):
+        fn = getattr(tts, meth, None)
+        if callable(fn):
+            if _accepts_kwarg(fn, 'format'):
+                return fn
+            return lambda text, voice, format=None: fn(text=text, voice=voice)
+    return None
+
+
+@functools.lru_cache(maxsize=4)
+def _sdk_list_voices(sdk, api_key: str):
+    """Return a no-argument callable listing voices through the SDK, or None.
+
+    Resolved once, in order: `client.voices()`, `client.voices.list()`, a plain
+    `client.voices` collection, then module-level `get_voices`/`list_voices`/`voices`.
+    """
+    client = _sdk_client(sdk, api_key)
+    if client is not None and hasattr(client, 'voices'):
+        voices = client.voices
+        if callable(voices):
+            return voices
+        if hasattr(voices, 'list'):
+            return voices.list
+        return lambda: voices
+    for name in ('get_voices', 'list_voices', 'voices'):
+        fn = getattr(sdk, name, None)
+        if callable(fn):
+            return functools.partial(fn, api_key=api_key)
+    return None
+
+
+def cache_path(cache_dir: Path, text: str, voice: str, fmt: str, model: str = None, normalize: bool = False) -> Path:
+    """Return the cache file for a synthesis request, keyed by SHA-256 of (voice, fmt, model, text).
+
+    With `normalize`, text is lowercased and whitespace-collapsed first so trivially
+    different inputs share an entry.
+    """
+    if normalize:
+        text = ' '.join(text.lower().split())
+    key = hashlib.sha256(f"{voice}|{fmt}|{model or ''}|{text}".encode('utf-8')).hexdigest()
+    return Path(cache_dir) / f"{key}.{fmt}"
+
+
+def _report_written(out_path: Path, size: int, note: str = ''):
+    """Print the 'Wrote audio' line; silent when streaming to stdout so the audio stays clean."""
+    if out_path == STDOUT:
+        return
+    print(f'Wrote audio: {out_path} ({size} bytes{note})')
+
+
+def _unshare_output(path: Path):
+    """Unlink `path` if it is a hard-linked regular file, so the next write gets a new inode.
+
+    A --hardlink output shares its inode with the cache entry; truncating it in place
+    would overwrite the cached audio as well. Anything else (single-link files, FIFOs,
+    symlinks) is written in place as usual.
+    """
+    try:
+        st = os.lstat(path)
+    except FileNotFoundError:
+        return
+    if stat.S_ISREG(st.st_mode) and st.st_nlink > 1:
+        path.unlink()
+
+
+def _copy_file(src: Path, dst: Path):
+    """Copy `src` to `dst`, in the kernel with copy_file_range (Linux) when `dst` is a regular file."""
+    _unshare_output(dst)
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        if hasattr(os, 'copy_file_range') and stat.S_ISREG(os.fstat(fdst.fileno()).st_mode):
+            try:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if not copied:
+                        break
+                    remaining -= copied
+                return
+            except OSError:
+                # e.g. cross-filesystem on older kernels: start over with a plain copy
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+        shutil.copyfileobj(fsrc, fdst, _COPY_BUFSIZE)
+
+
+def _place_cached(cached: Path, out_path: Path, hardlink: bool = False):
+    """Put the cache entry `cached` at `out_path`, as a hard link if requested and possible.
+
+    Only a missing or regular-file output is replaced by a link; FIFOs and symlinks
+    get the audio written through them.
+    """
+    if hardlink and not out_path.is_symlink() and (out_path.is_file() or not out_path.exists()):
+        try:
+            out_path.unlink(missing_ok=True)
+            os.link(cached, out_path)
+            return
+        except OSError:
+            # different filesystem or no link support: fall back to copying
+            pass
+    _copy_file(cached, out_path)
+
+
+def copy_from_cache(cached: Path, out_path: Path, hardlink: bool = False) -> bool:
+    """Copy (or with `hardlink`, link) a cached clip to `out_path`; return False on a cache miss."""
+    try:
+        # one stat answers both "is it cached?" and the size for the log line
+        st = cached.stat()
+    except OSError:
+        # missing, or the cache dir is unusable (e.g. a regular file); treated as a miss
+        return False
+    if not stat.S_ISREG(st.st_mode):
+        return False
+    size = st.st_size
+    if out_path == STDOUT:
+        with open(cached, 'rb') as src:
+            shutil.copyfileobj(src, sys.stdout.buffer, _COPY_BUFSIZE)
+        sys.stdout.buffer.flush()
+        return True
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    _place_cached(cached, out_path, hardlink)
+    _report_written(out_path, size, note=', cached')
+    return True
+
+
+def _open_cache_temp(cached: Path):
+    """Open a temp file next to `cached` for an atomic os.replace, or None if the cache is unwritable."""
+    try:
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        tmp = tempfile.NamedTemporaryFile(dir=cached.parent, suffix='.part', delete=False)
+        # NamedTemporaryFile is 0600; --hardlink outputs share this inode, so give it
+        # the same mode as a normally written output
+        os.fchmod(tmp.fileno(), 0o644)
+        return tmp
+    except OSError as e:
+        print(f'Warning: audio cache disabled ({e})', file=sys.stderr)
+        return None
+
+
+def _commit_cache(tmp_name: str, cached: Path) -> bool:
+    """Move a finished temp file into place as `cached`; warn and return False if that fails."""
+    try:
+        os.replace(tmp_name, cached)
+    except OSError as e:
+        # e.g. a directory sitting where the entry belongs
+        print(f'Warning: audio cache disabled ({e})', file=sys.stderr)
+        return False
+    return True
+
+
+def store_in_cache(cached: Path, data: bytes):
+    """Atomically write `data` as the cache entry `cached`."""
+    tmp = _open_cache_temp(cached)
+    if tmp is None:
+        return
+    with tmp:
+        tmp.write(data)
+    if not _commit_cache(tmp.name, cached):
+        os.unlink(tmp.name)
+
+
+def _write_all(path: Path, data):
+    """Write a bytes-like `data` to `path` with raw os.write calls over a memoryview (no copies)."""
+    _unshare_output(path)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            # os.write may write less than asked; continue from where it stopped
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=1)
+def _http2_client():
+    """Return the shared HTTP/2 httpx client, or None if httpx[http2] is not installed."""
+    try:
+        import httpx
+        # pool settings belong on the transport; httpx ignores client-level
+        # http2/limits once a transport is passed
+        client = httpx.Client(
+            timeout=60,
+            transport=httpx.HTTPTransport(http2=True, retries=2,
+                                          limits=httpx.Limits(max_keepalive_connections=16)),
+        )
+    except ImportError:
+        print('Warning: --http2 needs httpx with HTTP/2 support (pip install "httpx[http2]"); using requests', file=sys.stderr)
+        return None
+    atexit.register(client.close)
+    return client
+
+
+def _content_length(headers):
+    """Return the body size from `headers` when it equals the bytes to be written, else None."""
+    if headers.get('Content-Encoding', 'identity') != 'identity':
+        return None
+    try:
+        return int(headers.get('Content-Length'))
+    except (TypeError, ValueError):
+        return None
+
+
+def _preallocate(f, length) -> bool:
+    """Reserve `length` bytes for `f` up front so the file is laid out in one extent."""
+    if not length or not hasattr(os, 'posix_fallocate'):
+        return False
+    try:
+        os.posix_fallocate(f.fileno(), 0, length)
+    except OSError:
+        # e.g. filesystems without fallocate support
+        return False
+    return True
+
+
+def _read_chunks(src):
+    """Iterate `src.read(_COPY_BUFSIZE)` until EOF."""
+    return iter(functools.partial(src.read, _COPY_BUFSIZE), b'')
+
+
+def _write_chunks(dst, chunks) -> int:
+    """Write byte chunks to `dst` and return the total, so callers need no stat() afterwards."""
+    total = 0
+    for chunk in chunks:
+        dst.write(chunk)
+        total += len(chunk)
+    return total
+
+
+class _Tee:
+    """Write-only binary sink that copies every write to several files."""
+
+    def __init__(self, *files):
+        self._files = files
+
+    def write(self, data) -> int:
+        for f in self._files:
+            f.write(data)
+        return len(data)
+
+
+@contextlib.contextmanager
+def _open_output(out_path: Path, cached: Path = None, length: int = None, hardlink: bool = False):
+    """Yield a binary file to stream a response body into; finalize it on exit.
+
+    With `cached`, the body is downloaded into the cache first and then copied to
+    `out_path`, so an interrupted transfer never leaves a bad cache entry. A known
+    `length` is preallocated before writing. For `STDOUT` the body is passed straight
+    through (and teed into the cache).
+    """
+    to_stdout = out_path == STDOUT
+    if not to_stdout:
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = _open_cache_temp(cached) if cached is not None else None
+    try:
+        if to_stdout:
+            # pass bytes through as they arrive so a downstream player can start early
+            stdout = sys.stdout.buffer
+            with (tmp if tmp is not None else contextlib.nullcontext()):
+                yield _Tee(tmp, stdout) if tmp is not None else stdout
+            stdout.flush()
+        else:
+            if tmp is None:
+                _unshare_output(out_path)
+            with (tmp if tmp is not None else open(out_path, 'wb')) as dst:
+                allocated = _preallocate(dst, length)
+                yield dst
+                if allocated:
+                    # drop any unused reservation if the body came up short
+                    dst.truncate()
+        stored = tmp is not None and _commit_cache(tmp.name, cached)
+    except BaseException:
+        if tmp is not None:
+            os.unlink(tmp.name)
+        raise
+    if tmp is None:
+        return
+    if not stored:
+        # the cache refused the entry; deliver this download from the temp file instead
+        try:
+            if not to_stdout:
+                _copy_file(Path(tmp.name), out_path)
+        finally:
+            os.unlink(tmp.name)
+    elif not to_stdout:
+        _place_cached(cached, out_path, hardlink)
+
+
+def _tts_request(text: str, api_key: str, voice: str, endpoint: str, fmt: str = 'mp3', model: str = None):
+    """Return `(url, headers, payload)` for a text-to-speech POST."""
     url = endpoint.rstrip('/') + f"/v1/text-to-speech/{voice}"
-    mime_map = {
-        'mp3': 'audio/mpeg',
-        'wav': 'audio/wav',
-        'ogg': 'audio/ogg',
-    }
-    accept = mime_map.get(fmt, 'audio/mpeg')
+    accept = _MIME_MAP.get(fmt, 'audio/mpeg')
     # Eleven Labs expects the API key in the `xi-api-key` header for HTTP requests
     headers = {
         'xi-api-key': api_key,
         'Accept': accept,
+        # audio is already compressed; gzip would only cost server CPU and first-byte latency
+        'Accept-Encoding': 'identity',
         'Content-Type': 'application/json',
     }
     payload = { 'text': text }
+    if model:
+        payload['model_id'] = model
+    return url, headers, payload
 
-    with requests.post(url, headers=headers, json=payload, stream=True, timeout=60) as r:
-        if r.status_code != 200:
-            # try to show helpful error
-            try:
-                body = r.json()
-            except Exception:
-                body = r.text[:1000]
-            fail(f'ElevenLabs API error (status={r.status_code}): {body}')
 
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(out_path, 'wb') as f:
-            for chunk in r.iter_content(chunk_size=4096):
-                if chunk:
-                    f.write(chunk)
+def synthesize_via_http(text: str, api_key: str, voice: str, endpoint: str, out_path: Path, fmt: str = 'mp3',
+                        model: str = None, cache_dir: Path = None, normalize_cache_key: bool = False,
+                        http2: bool = False, hardlink: bool = False):
+    """Synthesize `text` over HTTP into `out_path`.
+
+    When `cache_dir` is given, a cached clip for the same request is copied (or with
+    `hardlink`, linked) instead of calling the API, and fresh responses are stored
+    there (atomically) for next time.
+    With `http2` (and httpx installed), requests are multiplexed over one shared
+    HTTP/2 connection, which pays off for concurrent --batch runs.
+    """
+    cached = None
+    if cache_dir is not None:
+        cached = cache_path(cache_dir, text, voice, fmt, model, normalize_cache_key)
+        if copy_from_cache(cached, out_path, hardlink):
+            return
+
+    url, headers, payload = _tts_request(text, api_key, voice, endpoint, fmt, model)
+
+    client = _http2_client() if http2 else None
+    if client is not None:
+        import httpx
+        try:
+            # the transport's `retries` only covers connects; statuses follow the session's RETRY policy
+            attempt = 0
+            while True:
+                with client.stream('POST', url, headers=headers, json=payload) as r:
+                    if r.status_code == 200:
+                        with _open_output(out_path, cached, _content_length(r.headers), hardlink) as dst:
+                            written = _write_chunks(dst, r.iter_bytes(_COPY_BUFSIZE))
+                        break
+                    wait = retry_wait('POST', r.status_code, r.headers.get('Retry-After'), attempt)
+                    if wait is None:
+                        r.read()
+                        try:
+                            body = r.json()
+                        except Exception:
+                            body = r.text[:1000]
+                        fail(f'ElevenLabs API error (status={r.status_code}): {body}')
+                time.sleep(wait)
+                attempt += 1
+        except httpx.TransportError as e:
+            fail(f'Network error while calling ElevenLabs: {e}')
+    else:
+        with _SESSION.post(url, headers=headers, json=payload, stream=True, timeout=60) as r:
+            if r.status_code != 200:
+                # try to show helpful error
+                try:
+                    body = r.json()
+                except Exception:
+                    body = r.text[:1000]
+                fail(f'ElevenLabs API error (status={r.status_code}): {body}')
+
+            # let urllib3 undo any transfer compression
+            r.raw.decode_content = True
+            with _open_output(out_path, cached, _content_length(r.headers), hardlink) as dst:
+                written = _write_chunks(dst, _read_chunks(r.raw))
+
+    _report_written(out_path, written)
+
+
+async def _asynthesize(session, text: str, api_key: str, voice: str, endpoint: str, out_path: Path,
+                       fmt: str = 'mp3', model: str = None, cache_dir: Path = None,
+                       normalize_cache_key: bool = False, hardlink: bool = False):
+    """asyncio counterpart of synthesize_via_http using an aiohttp `session`."""
+    cached = None
+    if cache_dir is not None:
+        cached = cache_path(cache_dir, text, voice, fmt, model, normalize_cache_key)
+        if copy_from_cache(cached, out_path, hardlink):
+            return
+
+    url, headers, payload = _tts_request(text, api_key, voice, endpoint, fmt, model)
+    # aiohttp has no status retries of its own, so apply the session's RETRY policy here
+    attempt = 0
+    while True:
+        async with session.post(url, headers=headers, json=payload) as r:
+            if r.status == 200:
+                # small sequential writes land in the page cache; they do not block the loop meaningfully
+                written = 0
+                with _open_output(out_path, cached, _content_length(r.headers), hardlink) as dst:
+                    async for chunk in r.content.iter_chunked(_COPY_BUFSIZE):
+                        dst.write(chunk)
+                        written += len(chunk)
+                break
+            wait = retry_wait('POST', r.status, r.headers.get('Retry-After'), attempt)
+            if wait is None:
+                body = (await r.text())[:1000]
+                fail(f'ElevenLabs API error (status={r.status}): {body}')
+        await asyncio.sleep(wait)
+        attempt += 1
+
+    _report_written(out_path, written)
+
+
+def _have_aiohttp() -> bool:
+    try:
+        import aiohttp  # noqa: F401
+    except ImportError:
+        print('Warning: --asyncio requires aiohttp; falling back to threads', file=sys.stderr)
+        return False
+    return True
+
 
-    print(f'Wrote audio: {out_path} ({out_path.stat().st_size} bytes)')
+# seconds allowed for each connect and each socket read in --asyncio batches
+_ASYNC_TIMEOUT = 60
+
+
+async def _asynthesize_batch(jobs, concurrency: int, **kwargs):
+    """Synthesize `(text, out_path)` jobs concurrently on one aiohttp session capped at `concurrency`."""
+    import aiohttp
+    connector = aiohttp.TCPConnector(limit=concurrency, ttl_dns_cache=300)
+    # per-connect/per-read limits like requests' timeout=60; a `total` would also count
+    # time spent queued for one of the `concurrency` connections and fail long batches
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=_ASYNC_TIMEOUT, sock_read=_ASYNC_TIMEOUT)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        try:
+            await asyncio.gather(*(_asynthesize(session, text=text, out_path=out_path, **kwargs)
+                                   for text, out_path in jobs))
+        except asyncio.TimeoutError:
+            fail(f'Network error while calling ElevenLabs: no response within {_ASYNC_TIMEOUT}s')
+        except aiohttp.ClientError as e:
+            fail(f'Network error while calling ElevenLabs: {e}')
 
 
 def list_voices_via_http(api_key: str, endpoint: str):
     url = endpoint.rstrip('/') + '/v1/voices'
     # Use `xi-api-key` header for listing voices over HTTP
     headers = {'xi-api-key': api_key, 'Accept': 'application/json'}
-    r = requests.get(url, headers=headers, timeout=20)
+    r = _SESSION.get(url, headers=headers, timeout=20)
     if r.status_code != 200:
         try:
             body = r.json()
@@ -100,7 +583,7 @@ def list_voices_via_http(api_key: str, endpoint: str):
             body = r.text[:1000]
         fail(f'ElevenLabs API error while listing voices (status={r.status_code}): {body}')
 
-    data = r.json()
+    data = _loads(r.content)
     # expect data to contain a list under 'voices' or be a list
     voices = data.get('voices') if isinstance(data, dict) else data
     if voices is None:
@@ -108,27 +591,16 @@ def list_voices_via_http(api_key: str, endpoint: str):
     return voices
 
 
+# main() needs the voice list for both id resolution and the filename label;
+# memoize so a single invocation only fetches it once. Failures are not cached.
+@functools.lru_cache(maxsize=1)
 def list_voices(api_key: str, endpoint: str, prefer_sdk: bool = True):
-    if prefer_sdk and HAS_SDK:
+    sdk = _get_sdk() if prefer_sdk else None
+    if sdk:
         try:
-            # Try a few common SDK patterns; on any failure, fall back to HTTP
-            Client = getattr(_eleven_sdk, 'Client', None) or getattr(_eleven_sdk, 'ElevenLabsClient', None)
-            if Client:
-                client = Client(api_key=api_key)
-                if hasattr(client, 'voices'):
-                    voices_obj = client.voices
-                    if callable(voices_obj):
-                        voices = voices_obj()
-                    elif hasattr(voices_obj, 'list'):
-                        voices = voices_obj.list()
-                    else:
-                        voices = voices_obj
-                    return voices
-
-            for name in ('get_voices', 'list_voices', 'voices'):
-                fn = getattr(_eleven_sdk, name, None)
-                if callable(fn):
-                    return fn(api_key=api_key)
+            fetch = _sdk_list_voices(sdk, api_key)
+            if fetch:
+                return fetch()
         except Exception:
             # fall back to HTTP below
             pass
@@ -137,60 +609,76 @@ def list_voices(api_key: str, endpoint: str, prefer_sdk: bool = True):
     return list_voices_via_http(api_key=api_key, endpoint=endpoint)
 
 
+def _voice_fields(v):
+    """Return `(id, name)` for a voice entry from either the SDK or the HTTP API."""
+    # support different API shapes: some responses use 'id', others 'voice_id'
+    if isinstance(v, dict):
+        return v.get('id') or v.get('voice_id'), v.get('name') or v.get('voice_name')
+    return (getattr(v, 'id', None) or getattr(v, 'voice_id', None),
+            getattr(v, 'name', None) or getattr(v, 'voice_name', None))
+
+
+@functools.lru_cache(maxsize=1)
+def voice_index(api_key: str, endpoint: str, prefer_sdk: bool = True):
+    """Return `(index, names)` built in one pass over the account's voices.
+
+    `index` maps each voice id, display name and normalized name to its voice id;
+    `names` maps voice id to display name. Earlier voices win on key collisions.
+    """
+    voices = list_voices(api_key=api_key, endpoint=endpoint, prefer_sdk=prefer_sdk)
+    # voices may be a dict with 'voices' or a list of dicts/objects
+    if isinstance(voices, dict) and 'voices' in voices:
+        voices = voices['voices']
+
+    index = {}
+    names = {}
+    for v in voices:
+        vid, name = _voice_fields(v)
+        if not vid:
+            continue
+        index.setdefault(vid, vid)
+        if name:
+            names.setdefault(vid, name)
+            index.setdefault(name, vid)
+            normalized = normalize_label(name)
+            if normalized:
+                index.setdefault(normalized, vid)
+    return index, names
+
+
 def resolve_voice_id(api_key: str, endpoint: str, voice_arg: str, prefer_sdk: bool = True) -> str:
     """Resolve a voice argument (id or name) to a voice_id.
 
-    - If `voice_arg` exactly matches a voice id, return it.
-    - Otherwise list available voices and try to match by `name` (exact or normalized).
+    - If `voice_arg` already has the shape of a canonical voice id, return it without a lookup.
+    - If `voice_arg` exactly matches a voice id or name, return that voice's id.
+    - Otherwise try to match by normalized name (lowercase, alphanumerics only).
     - If no match is found, return the original `voice_arg` and let the API report an error.
     """
-    if not voice_arg:
+    if not voice_arg or _VOICE_ID_RE.fullmatch(voice_arg):
         return voice_arg
 
     try:
-        voices = list_voices(api_key=api_key, endpoint=endpoint, prefer_sdk=prefer_sdk)
+        index, _ = voice_index(api_key=api_key, endpoint=endpoint, prefer_sdk=prefer_sdk)
     except Exception:
         return voice_arg
 
-    # Normalize helper: lowercase and remove non-alphanum
-    def norm(s: str) -> str:
-        return re.sub(r"[^a-z0-9]", "", s.lower()) if s else ""
-
-    target_norm = norm(voice_arg)
-
-    # voices may be a dict with 'voices' or a list of dicts/objects
-    if isinstance(voices, dict) and 'voices' in voices:
-        voices = voices['voices']
-
-    for v in voices:
-        # support different API shapes: some responses use 'id', others 'voice_id'
-        if isinstance(v, dict):
-            vid = v.get('id') or v.get('voice_id')
-            name = v.get('name') or v.get('voice_name')
-        else:
-            vid = getattr(v, 'id', None) or getattr(v, 'voice_id', None)
-            name = getattr(v, 'name', None) or getattr(v, 'voice_name', None)
-        if not vid and not name:
-            continue
-        # exact id match
-        if vid == voice_arg:
-            return vid
-        # exact name match
-        if name and name == voice_arg:
-            return vid
-        # normalized name match
-        if name and norm(name) == target_norm:
-            return vid
-
     # nothing matched; return original to let the server error if needed
-    return voice_arg
+    return index.get(voice_arg) or index.get(normalize_label(voice_arg)) or voice_arg
 
 
 def normalize_label(s: str) -> str:
     """Return a normalized lowercase label with only a-z0-9 characters."""
     if not s:
         return ""
-    return re.sub(r"[^a-z0-9]", "", s.lower())
+    s = s.lower()
+    # translate only covers ASCII; other characters still need the regex
+    return s.translate(_LABEL_TRANS) if s.isascii() else _NON_ALNUM_RE.sub("", s)
+
+
+@functools.lru_cache(maxsize=64)
+def _label_token_re(voice_label: str) -> re.Pattern:
+    """Return the compiled pattern matching `voice_label` as a separate filename token."""
+    return re.compile(rf'([_\-.]?){re.escape(voice_label)}([_\-.]?)', flags=re.IGNORECASE)
 
 
 def normalize_output_filename(voice_label: str, out_path: Path) -> Path:
@@ -204,9 +692,8 @@ def normalize_output_filename(voice_label: str, out_path: Path) -> Path:
     try:
         stem = out_path.stem
         suffix = out_path.suffix
-        token_pattern = rf'([_\-.]?){re.escape(voice_label)}([_\-.]?)'
-        cleaned = re.sub(token_pattern, '_', stem, flags=re.IGNORECASE)
-        cleaned = re.sub(r'[_\-.]+', '_', cleaned).strip('_')
+        cleaned = _label_token_re(voice_label).sub('_', stem)
+        cleaned = _SEP_RUN_RE.sub('_', cleaned).strip('_')
         if cleaned:
             new_name = f"{voice_label}_{cleaned}{suffix}"
         else:
@@ -219,6 +706,92 @@ def normalize_output_filename(voice_label: str, out_path: Path) -> Path:
         return out_path
 
 
+def synthesize_text(text: str, api_key: str, voice: str, endpoint: str, out_path: Path, fmt: str = 'mp3',
+                    model: str = None, cache_dir: Path = None, normalize_cache_key: bool = False,
+                    http2: bool = False, hardlink: bool = False):
+    """Synthesize `text` into `out_path`, preferring the SDK and falling back to HTTP.
+
+    A cached clip in `cache_dir` (if given) is used before either, and new SDK
+    results are stored there; the HTTP path caches its own responses.
+    """
+    cached = None
+    if cache_dir is not None:
+        cached = cache_path(cache_dir, text, voice, fmt, model, normalize_cache_key)
+        if copy_from_cache(cached, out_path, hardlink):
+            return
+
+    # prefer SDK when available, otherwise HTTP
+    sdk = _get_sdk()
+    if sdk:
+        piped = False
+        try:
+            synth = _sdk_tts(sdk, api_key)
+            if synth:
+                res = synth(text=text, voice=voice, format=fmt)
+                data = res if isinstance(res, (bytes, bytearray)) else getattr(res, 'content', None)
+                if hasattr(data, 'read'):
+                    if out_path == STDOUT:
+                        # buffer the clip so a stream failing part-way never reaches the pipe
+                        data = data.read()
+                    else:
+                        with _open_output(out_path, cached, hardlink=hardlink) as dst:
+                            written = _write_chunks(dst, _read_chunks(data))
+                        _report_written(out_path, written)
+                        return
+                if data:
+                    if out_path == STDOUT:
+                        piped = True
+                        sys.stdout.buffer.write(data)
+                        sys.stdout.buffer.flush()
+                    else:
+                        out_path.parent.mkdir(parents=True, exist_ok=True)
+                        _write_all(out_path, data)
+                    if cached is not None:
+                        store_in_cache(cached, data)
+                    _report_written(out_path, len(data))
+                    return
+        except Exception:
+            # audio already written to stdout cannot be taken back; falling back
+            # to HTTP would append a second copy to the stream
+            if piped:
+                raise
+
+    synthesize_via_http(text=text, api_key=api_key, voice=voice, endpoint=endpoint, out_path=out_path,
+                        fmt=fmt, model=model, cache_dir=cache_dir, normalize_cache_key=normalize_cache_key,
+                        http2=http2, hardlink=hardlink)
+
+
+def parse_batch(text: str, input_format: str = 'plain'):
+    """Split batch input into `(id, text)` pairs, skipping blank lines.
+
+    `plain` numbers lines from 0; `pipe` expects `id|text` on each line. Ids become
+    part of output filenames, so they must be non-empty, unique and free of path
+    separators.
+    """
+    items = []
+    seen = set()
+    for lineno, line in enumerate(text.splitlines(), 1):
+        line = line.strip()
+        if not line:
+            continue
+        if input_format == 'pipe':
+            ident, sep, line_text = line.partition('|')
+            if not sep:
+                fail(f'Batch line {lineno}: expected "id|text"')
+            ident = ident.strip()
+            if not ident:
+                fail(f'Batch line {lineno}: empty id')
+            if any(s and s in ident for s in _PATH_SEPS):
+                fail(f'Batch line {lineno}: id {ident!r} must not contain path separators')
+            if ident in seen:
+                fail(f'Batch line {lineno}: duplicate id {ident!r}')
+            seen.add(ident)
+            items.append((ident, line_text.strip()))
+        else:
+            items.append((str(len(items)), line))
+    return items
+
+
 def main(argv=None):
     parser = argparse.ArgumentParser(description='Synthesize text to speech via Eleven Labs')
     group = parser.add_mutually_exclusive_group(required=False)
@@ -230,9 +803,19 @@ def main(argv=None):
     parser.add_argument('--list-voices', action='store_true', help='List available voices and exit')
     parser.add_argument('--debug-env', action='store_true', help='Print non-sensitive env debug info and exit')
     parser.add_argument('--format', choices=['mp3', 'wav', 'ogg'], default='mp3', help='Output audio format (default: mp3)')
-    parser.add_argument('--output', '-o', default='generated/output.mp3', help='Output audio path')
+    parser.add_argument('--output', '-o', default='generated/output.mp3', help='Output audio path, or - to write audio to stdout')
     parser.add_argument('--endpoint', default='https://api.elevenlabs.io', help='Eleven Labs API base endpoint')
     parser.add_argument('--api-key', help=f'Eleven Labs API key (or set {env_var_name} env var)')
+    parser.add_argument('--model', help='Model id to synthesize with (default: the API default)')
+    parser.add_argument('--cache-dir', default=str(DEFAULT_CACHE_DIR), help=f'Directory for cached audio (default: {DEFAULT_CACHE_DIR})')
+    parser.add_argument('--no-cache', action='store_true', help='Always call the API; do not read or write the audio cache')
+    parser.add_argument('--hardlink', action='store_true', help='Hard-link cached audio into place instead of copying (do not edit outputs in place)')
+    parser.add_argument('--normalize-cache-key', action='store_true', help='Lowercase and collapse whitespace in text before cache lookup to widen hits')
+    parser.add_argument('--batch', action='store_true', help='Synthesize each input line to its own file (output_<id>.ext)')
+    parser.add_argument('--input-format', choices=['plain', 'pipe'], default='plain', help='Batch line format: plain text or "id|text" (default: plain)')
+    parser.add_argument('--num-parallel-requests', type=int, default=1, help='Concurrent synthesis requests in --batch mode (default: 1)')
+    parser.add_argument('--http2', action='store_true', help='Send HTTP requests over one multiplexed HTTP/2 connection (requires httpx[http2])')
+    parser.add_argument('--asyncio', action='store_true', help='Run --batch requests on an asyncio event loop over HTTP (requires aiohttp)')
     args = parser.parse_args(argv)
 
     api_key = args.api_key or os.environ.get(env_var_name)
@@ -260,8 +843,7 @@ def main(argv=None):
             if isinstance(voices, dict) and 'voices' in voices:
                 voices = voices['voices']
             for v in voices:
-                vid = v.get('id') if isinstance(v, dict) else getattr(v, 'id', None)
-                name = v.get('name') if isinstance(v, dict) else getattr(v, 'name', None)
+                vid, name = _voice_fields(v)
                 print(f"{vid}\t{name}")
         except Exception as e:
             fail(f'Failed to list voices: {e}')
@@ -269,14 +851,16 @@ def main(argv=None):
 
     text = load_text(args)
 
-    out_path = Path(args.output)
-    # ensure output extension matches selected format
+    # ensure output extension matches selected format (added if missing, replaced if different)
     fmt = args.format.lower() if getattr(args, 'format', None) else 'mp3'
-    if out_path.suffix == '':
-        out_path = out_path.with_suffix('.' + fmt)
+    if args.output == '-':
+        if args.batch:
+            fail('Error: --output - cannot be combined with --batch', code=2)
+        out_path = STDOUT
     else:
-        # if provided extension doesn't match requested format, replace it
-        if out_path.suffix.lower() != ('.' + fmt):
+        # Path semantics on purpose: `out/` becomes `out.mp3` and `foo.` has no suffix
+        out_path = Path(args.output)
+        if out_path.suffix.lower() != '.' + fmt:
             out_path = out_path.with_suffix('.' + fmt)
 
     # Resolve voice name -> voice_id if needed (accept friendly names)
@@ -287,7 +871,9 @@ def main(argv=None):
         args.voice = resolved_voice
     # If requested, print the resolved mapping for user confirmation
     if getattr(args, 'voice_name', False):
-        print(f"Resolved voice id for '{original_voice}': {args.voice}")
+        # keep stdout clean for audio when streaming
+        print(f"Resolved voice id for '{original_voice}': {args.voice}",
+              file=sys.stderr if out_path == STDOUT else sys.stdout)
     if getattr(args, 'show_only', False):
         # Print resolved id and exit without calling the TTS API
         print(f"Show-only: resolved voice id for '{original_voice}': {args.voice}")
@@ -299,24 +885,16 @@ def main(argv=None):
         if 'generated' in out_parent.split(os.sep):
             voice_label = None
             # If user provided a friendly original name, prefer that
-            if original_voice and not re.match(r"^[A-Za-z0-9_-]{6,}$", original_voice):
+            if original_voice and not _ID_LIKE_RE.match(original_voice):
                 voice_label = normalize_label(original_voice)
+                # already named `voicename_description.ext`; nothing to rename
+                if out_path.stem.startswith(f"{voice_label}_"):
+                    voice_label = None
             else:
                 # Try to look up the display name for the resolved voice id
                 try:
-                    voices = list_voices(api_key=api_key, endpoint=args.endpoint)
-                    if isinstance(voices, dict) and 'voices' in voices:
-                        voices = voices['voices']
-                    for v in voices:
-                        if isinstance(v, dict):
-                            vid = v.get('id') or v.get('voice_id')
-                            name = v.get('name') or v.get('voice_name')
-                        else:
-                            vid = getattr(v, 'id', None) or getattr(v, 'voice_id', None)
-                            name = getattr(v, 'name', None) or getattr(v, 'voice_name', None)
-                        if vid == args.voice and name:
-                            voice_label = normalize_label(name)
-                            break
+                    _, names = voice_index(api_key=api_key, endpoint=args.endpoint, prefer_sdk=True)
+                    voice_label = normalize_label(names.get(args.voice)) or None
                 except Exception:
                     voice_label = None
 
@@ -326,38 +904,26 @@ def main(argv=None):
         # Don't fail synthesis over filename prefixing issues
         pass
 
-    # prefer SDK when available, otherwise HTTP
-    if HAS_SDK:
-        try:
-            Client = getattr(_eleven_sdk, 'Client', None) or getattr(_eleven_sdk, 'ElevenLabsClient', None)
-            if Client:
-                client = Client(api_key=api_key)
-                tts = getattr(client, 'text_to_speech', None) or getattr(client, 'tts', None)
-                if tts:
-                    for meth in ('synthesize', 'speak', 'generate'):
-                        fn = getattr(tts, meth, None)
-                        if callable(fn):
-                            # try passing format if the SDK method accepts it
-                            try:
-                                res = fn(text=text, voice=args.voice, format=fmt)
-                            except TypeError:
-                                res = fn(text=text, voice=args.voice)
-                            if isinstance(res, (bytes, bytearray)):
-                                out_path.parent.mkdir(parents=True, exist_ok=True)
-                                out_path.write_bytes(res)
-                                print(f'Wrote audio: {out_path} ({out_path.stat().st_size} bytes)')
-                                return
-                            data = getattr(res, 'content', None)
-                            if data:
-                                out_path.parent.mkdir(parents=True, exist_ok=True)
-                                out_path.write_bytes(data)
-                                print(f'Wrote audio: {out_path} ({out_path.stat().st_size} bytes)')
-                                return
-        except Exception:
-            pass
-
+    cache_dir = None if args.no_cache else Path(args.cache_dir)
+    synth_kwargs = dict(api_key=api_key, voice=args.voice, endpoint=args.endpoint, fmt=fmt, model=args.model,
+                        cache_dir=cache_dir, normalize_cache_key=args.normalize_cache_key, http2=args.http2,
+                        hardlink=args.hardlink)
     try:
-        synthesize_via_http(text=text, api_key=api_key, voice=args.voice, endpoint=args.endpoint, out_path=out_path)
+        if args.batch:
+            jobs = [
+                (line_text, out_path.with_name(f"{out_path.stem}_{ident}{out_path.suffix}"))
+                for ident, line_text in parse_batch(text, args.input_format)
+            ]
+            if args.asyncio and _have_aiohttp():
+                # one event loop instead of a thread per request; HTTP only, the SDK is synchronous
+                async_kwargs = {k: v for k, v in synth_kwargs.items() if k != 'http2'}
+                asyncio.run(_asynthesize_batch(jobs, max(1, args.num_parallel_requests), **async_kwargs))
+                return
+            # requests are network-bound; the pool size caps in-flight calls for SDK and HTTP alike
+            with ThreadPoolExecutor(max_workers=max(1, args.num_parallel_requests)) as executor:
+                list(executor.map(lambda job: synthesize_text(text=job[0], out_path=job[1], **synth_kwargs), jobs))
+        else:
+            synthesize_text(text=text, out_path=out_path, **synth_kwargs)
     except requests.exceptions.RequestException as e:
         fail(f'Network error while calling ElevenLabs: {e}')
 
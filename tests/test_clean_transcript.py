@@ -0,0 +1,70 @@
+import importlib.util
+import os
+import pathlib
+import threading
+
+import pytest
+
+# Load the cleaner script by path since scripts/ is not a package
+repo_root = pathlib.Path(__file__).resolve().parents[1]
+spec = importlib.util.spec_from_file_location("clean_transcript", str(repo_root / "scripts" / "clean_transcript.py"))
+clean_transcript = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(clean_transcript)
+
+
+def test_removes_cues_fillers_and_whitespace():
+    text = "[music] uh hello   there.\n um I mean it works [laughs] fine."
+    assert clean_transcript.clean_text(text) == "Hello there. It works fine."
+
+
+def test_collapses_consecutive_duplicates():
+    text = "Hello there. hello there. Bye."
+    assert clean_transcript.clean_text(text) == "Hello there. Bye."
+
+
+def test_empty_input():
+    assert clean_transcript.clean_text("  [on hold music]  ") == ""
+
+
+def test_filler_with_punctuation_keeps_sentence_end():
+    assert clean_transcript.clean_text("Ok yeah, sure. It works, right?") == "Ok sure. It works?"
+
+
+def test_phrase_fillers_take_their_punctuation():
+    assert clean_transcript.clean_text("So, I mean, it works.") == "So, it works."
+    assert clean_transcript.clean_text("You know. It works, you know?") == "It works?"
+    assert clean_transcript.clean_text("Do you, know it?") == "Do you, know it?"
+
+
+def test_drops_non_consecutive_duplicates():
+    text = "Can you hear me? Yes. can you hear me? Good."
+    assert clean_transcript.clean_text(text) == "Can you hear me? Yes. Good."
+
+
+def test_main_reads_and_writes_files(tmp_path):
+    inp = tmp_path / "in.txt"
+    outp = tmp_path / "out.txt"
+    inp.write_text("uh café [noise] time. café time.", encoding="utf-8")
+    assert clean_transcript.main(["clean_transcript.py", str(inp), str(outp)]) == 0
+    assert outp.read_text(encoding="utf-8") == "Café time."
+
+    inp.write_bytes(b"")
+    assert clean_transcript.main(["clean_transcript.py", str(inp), str(outp)]) == 0
+    assert outp.read_text(encoding="utf-8") == ""
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs os.mkfifo")
+def test_read_text_handles_pipes(tmp_path):
+    fifo = tmp_path / "in.fifo"
+    os.mkfifo(fifo)
+
+    def feed():
+        with open(fifo, "wb") as w:
+            w.write("um piped café.".encode("utf-8"))
+
+    writer = threading.Thread(target=feed)
+    writer.start()
+    try:
+        assert clean_transcript.clean_text(clean_transcript.read_text(str(fifo))) == "Piped café."
+    finally:
+        writer.join()
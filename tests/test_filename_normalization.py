@@ -26,3 +26,9 @@ def test_voice_only_case():
     voice = 'andrewcohan'
     # current behavior: if filename equals voice, produce voice_voice.ext
     assert nm(voice, 'andrewcohan.mp3') == 'andrewcohan_andrewcohan.mp3'
+
+
+def test_normalize_label():
+    assert synthesize.normalize_label('Andrew Cohan') == 'andrewcohan'
+    assert synthesize.normalize_label('Zoë-2') == 'zo2'
+    assert synthesize.normalize_label('') == ''
@@ -0,0 +1,99 @@
+import io
+import subprocess
+import sys
+import threading
+import wave
+
+import pytest
+
+import integration_example
+
+
+def _write_wav(path, channels, rate):
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(channels)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(b"\x00\x00" * channels * 160)
+    return str(path)
+
+
+def test_is_wav_mono_16k(tmp_path):
+    assert integration_example._is_wav_mono_16k(_write_wav(tmp_path / "mono.wav", 1, 16000))
+    assert not integration_example._is_wav_mono_16k(_write_wav(tmp_path / "stereo.wav", 2, 44100))
+    # not a WAV at all, whatever the extension says
+    bogus = tmp_path / "bogus.wav"
+    bogus.write_bytes(b"ID3 not really audio")
+    assert not integration_example._is_wav_mono_16k(str(bogus))
+    assert not integration_example._is_wav_mono_16k(str(tmp_path / "clip.mp3"))
+
+
+def test_mono_16k_wav_passes_through_without_ffmpeg(tmp_path, monkeypatch):
+    def no_run(*args, **kwargs):
+        raise AssertionError("ffmpeg should not run for a mono 16 kHz WAV")
+
+    monkeypatch.setattr(integration_example.subprocess, "run", no_run)
+    path = _write_wav(tmp_path / "mono.wav", 1, 16000)
+    assert integration_example._ensure_wav_mono_16k(path) == path
+
+
+def test_stereo_wav_is_converted_through_ffmpeg(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_run(argv, **kwargs):
+        calls.append(argv)
+        return subprocess.CompletedProcess(argv, 0, stdout=b"RIFFconverted", stderr=b"")
+
+    monkeypatch.setattr(integration_example.shutil, "which", lambda name: "/usr/bin/ffmpeg")
+    monkeypatch.setattr(integration_example.subprocess, "run", fake_run)
+    path = _write_wav(tmp_path / "stereo.wav", 2, 44100)
+    audio = integration_example._ensure_wav_mono_16k(path)
+
+    assert calls == [["/usr/bin/ffmpeg", "-hide_banner", "-loglevel", "error", "-i", path,
+                      "-ac", "1", "-ar", "16000", "-f", "wav", "pipe:1"]]
+    assert isinstance(audio, io.BytesIO)
+    assert audio.name == "stereo.wav"
+    assert audio.getvalue() == b"RIFFconverted"
+
+
+def test_ffmpeg_failure_raises(tmp_path, monkeypatch):
+    def fake_run(argv, **kwargs):
+        return subprocess.CompletedProcess(argv, 1, stdout=b"", stderr=b"Invalid data found\n")
+
+    monkeypatch.setattr(integration_example.shutil, "which", lambda name: "/usr/bin/ffmpeg")
+    monkeypatch.setattr(integration_example.subprocess, "run", fake_run)
+    with pytest.raises(RuntimeError, match="Invalid data found"):
+        integration_example._ensure_wav_mono_16k(str(tmp_path / "clip.mp3"))
+
+
+def test_missing_ffmpeg_sends_original(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(integration_example.shutil, "which", lambda name: None)
+    path = str(tmp_path / "clip.mp3")
+    assert integration_example._ensure_wav_mono_16k(path) == path
+    assert "ffmpeg not found" in capsys.readouterr().out
+
+
+def test_main_runs_jobs_concurrently_and_reports_in_order(monkeypatch, capsys):
+    second_done = threading.Event()
+
+    def fake_transcribe(audio, api_key, endpoint):
+        assert api_key == "sk_test"
+        if audio == "first.wav":
+            # only finishes once the second file has, so output order cannot follow completion order
+            assert second_done.wait(5)
+            return {"text": "first text"}
+        second_done.set()
+        raise ValueError("bad audio")
+
+    monkeypatch.setattr(integration_example, "transcribe_file", fake_transcribe)
+    monkeypatch.setenv("ELEVENLABS_API_KEY", "sk_test")
+    monkeypatch.setattr(sys, "argv", ["integration_example.py", "--jobs", "2", "--no-convert",
+                                      "first.wav", "second.wav"])
+    with pytest.raises(SystemExit) as exc:
+        integration_example.main()
+    assert exc.value.code == 1
+
+    out = capsys.readouterr().out
+    expected = ["== first.wav", "first text", "== second.wav", "Transcription failed: bad audio"]
+    positions = [out.index(line) for line in expected]
+    assert positions == sorted(positions)
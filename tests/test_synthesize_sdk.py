@@ -7,6 +7,7 @@ ROOT = P(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
 import synthesize
+from test_synthesize_write import fake_post_factory
 
 
 def test_sdk_path_writes_file(tmp_path, monkeypatch):
@@ -33,7 +34,168 @@ def test_sdk_path_writes_file(tmp_path, monkeypatch):
     monkeypatch.setenv(synthesize.env_var_name, 'TEST_API_KEY_REDACTED')
 
     # Call main with arguments that cause SDK branch to run
-    synthesize.main(["--text", "hello sdk", "--voice", "fakevoice", "--output", str(out)])
+    synthesize.main(["--text", "hello sdk", "--voice", "fakevoice", "--output", str(out), "--no-cache"])
 
     assert out.exists()
     assert out.read_bytes() == b"SDKBYTES"
+
+
+def test_voices_listed_once_per_invocation(tmp_path, monkeypatch):
+    out = tmp_path / "generated" / "clip.mp3"
+    listed = []
+
+    class FakeTTS:
+        def synthesize(self, text=None, voice=None, format=None):
+            return b"SDKBYTES"
+
+    class FakeClient:
+        def __init__(self, api_key=None):
+            self.text_to_speech = FakeTTS()
+
+        def voices(self):
+            listed.append(True)
+            return [{"id": "fakevoiceid", "name": "Fake Voice"}]
+
+    fake_sdk = type("fake_sdk", (), {"Client": FakeClient})
+    monkeypatch.setattr(synthesize, '_eleven_sdk', fake_sdk)
+    monkeypatch.setattr(synthesize, 'HAS_SDK', True)
+    monkeypatch.setenv(synthesize.env_var_name, 'TEST_API_KEY_REDACTED_ONCE')
+    synthesize.list_voices.cache_clear()
+    synthesize.voice_index.cache_clear()
+
+    # an id-shaped voice needs the voice list for both resolution and the filename label
+    synthesize.main(["--text", "hello", "--voice", "fakevoiceid", "--output", str(out), "--no-cache"])
+
+    assert len(listed) == 1
+    assert (tmp_path / "generated" / "fakevoice_clip.mp3").read_bytes() == b"SDKBYTES"
+
+
+def test_resolve_voice_id_skips_lookup_for_canonical_id(monkeypatch):
+    calls = []
+    monkeypatch.setattr(synthesize, 'list_voices', lambda **kwargs: calls.append(kwargs) or [])
+    assert synthesize.resolve_voice_id('key', 'https://api.elevenlabs.io', '21m00Tcm4TlvDq8ikWAM') == '21m00Tcm4TlvDq8ikWAM'
+    assert calls == []
+
+
+def test_resolve_voice_id_matches_names(monkeypatch):
+    voices = [{"voice_id": "id_one", "name": "Andrew Cohan"}, {"id": "id_two", "name": "Rachel"}]
+    monkeypatch.setattr(synthesize, 'list_voices', lambda **kwargs: voices)
+    synthesize.voice_index.cache_clear()
+    try:
+        resolve = lambda arg: synthesize.resolve_voice_id('key', 'https://api.elevenlabs.io', arg)
+        assert resolve('Rachel') == 'id_two'
+        assert resolve('andrew-cohan') == 'id_one'
+        assert resolve('id_one') == 'id_one'
+        assert resolve('nobody') == 'nobody'
+    finally:
+        synthesize.voice_index.cache_clear()
+
+
+def test_sdk_method_without_format_is_called_once(tmp_path, monkeypatch):
+    out = tmp_path / "noformat.mp3"
+    calls = []
+
+    class FakeTTS:
+        def generate(self, text=None, voice=None):
+            calls.append((text, voice))
+            return type("Res", (), {"content": b"CONTENT"})()
+
+    class FakeClient:
+        def __init__(self, api_key=None):
+            self.tts = FakeTTS()
+            self.voices = []
+
+    monkeypatch.setattr(synthesize, '_eleven_sdk', type("fake_sdk", (), {"ElevenLabsClient": FakeClient}))
+    monkeypatch.setattr(synthesize, 'HAS_SDK', True)
+    monkeypatch.setenv(synthesize.env_var_name, 'TEST_API_KEY_REDACTED')
+
+    synthesize.main(["--text", "hi", "--voice", "21m00Tcm4TlvDq8ikWAM", "--output", str(out), "--no-cache"])
+
+    assert calls == [("hi", "21m00Tcm4TlvDq8ikWAM")]
+    assert out.read_bytes() == b"CONTENT"
+
+
+def test_sdk_is_imported_lazily(monkeypatch):
+    import types
+    fake_module = types.ModuleType("elevenlabs")
+    monkeypatch.setitem(sys.modules, "elevenlabs", fake_module)
+    monkeypatch.setattr(synthesize, '_eleven_sdk', None)
+    monkeypatch.setattr(synthesize, 'HAS_SDK', None)
+
+    assert synthesize._get_sdk() is fake_module
+    assert synthesize.HAS_SDK is True
+
+    monkeypatch.setattr(synthesize, 'HAS_SDK', False)
+    assert synthesize._get_sdk() is None
+
+
+def test_sdk_bytearray_and_stream_results(tmp_path, monkeypatch):
+    import io
+    results = [bytearray(b"ARRAY"), type("Res", (), {"content": io.BytesIO(b"STREAMED")})()]
+
+    class FakeTTS:
+        def synthesize(self, text=None, voice=None, format=None):
+            return results.pop(0)
+
+    class FakeClient:
+        def __init__(self, api_key=None):
+            self.text_to_speech = FakeTTS()
+
+    monkeypatch.setattr(synthesize, '_eleven_sdk', type("fake_sdk", (), {"Client": FakeClient}))
+    monkeypatch.setattr(synthesize, 'HAS_SDK', True)
+
+    out = tmp_path / "sdk.mp3"
+    out.write_bytes(b"A MUCH LONGER STALE FILE")
+    synthesize.synthesize_text('hi', 'sk_test', '21m00Tcm4TlvDq8ikWAM', 'https://api.elevenlabs.io', out)
+    assert out.read_bytes() == b"ARRAY"
+    synthesize.synthesize_text('hi', 'sk_test', '21m00Tcm4TlvDq8ikWAM', 'https://api.elevenlabs.io', out)
+    assert out.read_bytes() == b"STREAMED"
+
+
+def test_sdk_voice_listing_shapes(monkeypatch):
+    voices = [{"voice_id": "v1", "name": "One"}]
+
+    class Voices:
+        def list(self):
+            return voices
+
+    class ListClient:
+        def __init__(self, api_key=None):
+            self.voices = Voices()
+
+    module_level = type("mod_sdk", (), {"get_voices": staticmethod(lambda api_key=None: voices if api_key == "k" else None)})
+
+    for sdk in (type("list_sdk", (), {"Client": ListClient}), module_level):
+        synthesize.list_voices.cache_clear()
+        monkeypatch.setattr(synthesize, '_eleven_sdk', sdk)
+        monkeypatch.setattr(synthesize, 'HAS_SDK', True)
+        assert synthesize.list_voices("k", "https://api.elevenlabs.io") == voices
+    synthesize.list_voices.cache_clear()
+
+
+def test_sdk_stream_failure_does_not_corrupt_stdout(monkeypatch, capsysbinary):
+    class FlakyStream:
+        def __init__(self):
+            self.sent = False
+
+        def read(self, size=-1):
+            # the connection drops after the first chunk
+            if size == -1 or self.sent:
+                raise IOError("connection reset")
+            self.sent = True
+            return b"PART"
+
+    class FakeTTS:
+        def synthesize(self, text=None, voice=None, format=None):
+            return type("Res", (), {"content": FlakyStream()})()
+
+    class FakeClient:
+        def __init__(self, api_key=None):
+            self.text_to_speech = FakeTTS()
+
+    monkeypatch.setattr(synthesize, '_eleven_sdk', type("fake_sdk", (), {"Client": FakeClient}))
+    monkeypatch.setattr(synthesize, 'HAS_SDK', True)
+    monkeypatch.setattr(synthesize._SESSION, 'post', fake_post_factory(b"HTTPAUDIO"))
+
+    synthesize.synthesize_text('hi', 'sk_test', '21m00Tcm4TlvDq8ikWAM', 'https://api.elevenlabs.io', synthesize.STDOUT)
+    assert capsysbinary.readouterr().out == b"HTTPAUDIO"
@@ -1,13 +1,18 @@
 from pathlib import Path
 import io
+import os
+import threading
+import pytest
 import synthesize
 
 
 class DummyResponse:
-    def __init__(self, content_bytes: bytes, status_code=200):
+    def __init__(self, content_bytes: bytes, status_code=200, headers=None):
         self._content = content_bytes
         self.status_code = status_code
-        self._iter = None
+        self.headers = headers if headers is not None else {}
+        # urllib3-like raw stream consumed by shutil.copyfileobj
+        self.raw = io.BytesIO(content_bytes)
 
     def __enter__(self):
         # requests.Response-like
@@ -16,10 +21,6 @@ class DummyResponse:
     def __exit__(self, exc_type, exc, tb):
         return False
 
-    def iter_content(self, chunk_size=4096):
-        # yield the content in one chunk for simplicity
-        yield self._content
-
     def json(self):
         return {"message": "ok"}
 
@@ -35,9 +36,8 @@ def test_synthesize_via_http_writes_file(tmp_path, monkeypatch):
     out = tmp_path / "out.mp3"
     sample = b"FAKEAUDIOBYTES"
 
-    # Monkeypatch requests.post used inside synthesize_via_http
-    import requests
-    monkeypatch.setattr(requests, 'post', fake_post_factory(sample))
+    # Monkeypatch the shared session's post used inside synthesize_via_http
+    monkeypatch.setattr(synthesize._SESSION, 'post', fake_post_factory(sample))
 
     # Call the function under test
     synthesize.synthesize_via_http(text='hello', api_key='sk_test', voice='voiceid', endpoint='https://api.elevenlabs.io', out_path=out, fmt='mp3')
@@ -46,3 +46,318 @@ def test_synthesize_via_http_writes_file(tmp_path, monkeypatch):
     assert out.exists()
     data = out.read_bytes()
     assert data == sample
+
+
+def test_synthesize_via_http_serves_repeat_requests_from_cache(tmp_path, monkeypatch):
+    calls = []
+    post = fake_post_factory(b"CACHEDAUDIO")
+
+    def counting_post(*args, **kwargs):
+        calls.append(kwargs.get('json'))
+        return post(*args, **kwargs)
+
+    monkeypatch.setattr(synthesize._SESSION, 'post', counting_post)
+    cache_dir = tmp_path / "cache"
+    kwargs = dict(text='hello', api_key='sk_test', voice='voiceid', endpoint='https://api.elevenlabs.io',
+                  fmt='mp3', cache_dir=cache_dir)
+
+    synthesize.synthesize_via_http(out_path=tmp_path / "first.mp3", **kwargs)
+    synthesize.synthesize_via_http(out_path=tmp_path / "second.mp3", **kwargs)
+
+    assert calls == [{'text': 'hello'}]
+    assert (tmp_path / "second.mp3").read_bytes() == b"CACHEDAUDIO"
+    assert [p.suffix for p in cache_dir.iterdir()] == ['.mp3']
+
+
+def test_cache_hits_copy_or_hardlink_into_place(tmp_path, monkeypatch):
+    monkeypatch.setattr(synthesize._SESSION, 'post', fake_post_factory(b"CACHEDAUDIO"))
+    kwargs = dict(text='hello', api_key='sk_test', voice='voiceid', endpoint='https://api.elevenlabs.io',
+                  cache_dir=tmp_path / "cache")
+    copied, linked = tmp_path / "copied.mp3", tmp_path / "linked.mp3"
+    copied.write_bytes(b"OLDER AND LONGER CONTENTS")
+
+    synthesize.synthesize_via_http(out_path=copied, **kwargs)
+    synthesize.synthesize_via_http(out_path=linked, hardlink=True, **kwargs)
+
+    cached, = (tmp_path / "cache").iterdir()
+    assert copied.read_bytes() == linked.read_bytes() == b"CACHEDAUDIO"
+    assert not copied.samefile(cached)
+    assert linked.samefile(cached)
+    assert cached.stat().st_mode & 0o777 == 0o644
+
+
+def test_rewriting_a_hardlinked_output_keeps_the_cache_entry(tmp_path, monkeypatch):
+    monkeypatch.setattr(synthesize._SESSION, 'post', fake_post_factory(b"FIRST"))
+    out = tmp_path / "out.mp3"
+    kwargs = dict(api_key='sk_test', voice='voiceid', endpoint='https://api.elevenlabs.io', out_path=out)
+    synthesize.synthesize_via_http(text='first', cache_dir=tmp_path / "cache", hardlink=True, **kwargs)
+    synthesize.synthesize_via_http(text='first', cache_dir=tmp_path / "cache", hardlink=True, **kwargs)
+    cached, = (tmp_path / "cache").iterdir()
+    assert out.samefile(cached)
+
+    monkeypatch.setattr(synthesize._SESSION, 'post', fake_post_factory(b"SECOND"))
+    synthesize.synthesize_via_http(text='second', **kwargs)
+    assert out.read_bytes() == b"SECOND"
+    assert cached.read_bytes() == b"FIRST"
+
+
+def test_outputs_are_written_through_symlinks(tmp_path, monkeypatch):
+    monkeypatch.setattr(synthesize._SESSION, 'post', fake_post_factory(b"AUDIO"))
+    target = tmp_path / "target.mp3"
+    target.write_bytes(b"OLD")
+    link = tmp_path / "link.mp3"
+    link.symlink_to(target)
+    kwargs = dict(text='hi', api_key='sk_test', voice='voiceid', endpoint='https://api.elevenlabs.io', out_path=link)
+
+    synthesize.synthesize_via_http(**kwargs)
+    synthesize.synthesize_via_http(cache_dir=tmp_path / "cache", **kwargs)
+    # cache hit, also with --hardlink: the link must not replace the symlink
+    synthesize.synthesize_via_http(cache_dir=tmp_path / "cache", hardlink=True, **kwargs)
+    assert link.is_symlink()
+    assert target.read_bytes() == b"AUDIO"
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs os.mkfifo")
+@pytest.mark.parametrize("cached", [False, True])
+def test_output_streams_into_fifo(tmp_path, monkeypatch, cached):
+    monkeypatch.setattr(synthesize._SESSION, 'post', fake_post_factory(b"PIPEDAUDIO"))
+    kwargs = dict(text='hi', api_key='sk_test', voice='voiceid', endpoint='https://api.elevenlabs.io')
+    if cached:
+        kwargs['cache_dir'] = tmp_path / "cache"
+        synthesize.synthesize_via_http(out_path=tmp_path / "warm.mp3", **kwargs)
+
+    fifo = tmp_path / "player.mp3"
+    os.mkfifo(fifo)
+    received = []
+    reader = threading.Thread(target=lambda: received.append(fifo.read_bytes()))
+    reader.start()
+    try:
+        synthesize.synthesize_via_http(out_path=fifo, **kwargs)
+    finally:
+        reader.join(timeout=5)
+    assert received == [b"PIPEDAUDIO"]
+    assert fifo.is_fifo()
+
+
+@pytest.mark.parametrize("broken", ["cache_dir_is_file", "entry_is_dir"])
+def test_unusable_cache_is_treated_as_a_miss(tmp_path, monkeypatch, capsys, broken):
+    monkeypatch.setattr(synthesize._SESSION, 'post', fake_post_factory(b"AUDIO"))
+    cache_dir = tmp_path / "cache"
+    kwargs = dict(text='hi', api_key='sk_test', voice='voiceid', endpoint='https://api.elevenlabs.io',
+                  cache_dir=cache_dir)
+    if broken == "cache_dir_is_file":
+        cache_dir.write_bytes(b"not a directory")
+    else:
+        synthesize.cache_path(cache_dir, 'hi', 'voiceid', 'mp3').mkdir(parents=True)
+
+    out = tmp_path / "out.mp3"
+    synthesize.synthesize_via_http(out_path=out, **kwargs)
+    assert out.read_bytes() == b"AUDIO"
+    assert "audio cache disabled" in capsys.readouterr().err
+    if broken == "entry_is_dir":
+        # no temp files are left behind next to the blocked entry
+        assert [p.suffix for p in cache_dir.iterdir()] == ['.mp3']
+
+
+def test_cache_path_keys_on_request_fields(tmp_path):
+    base = synthesize.cache_path(tmp_path, 'Hello  World', 'v', 'mp3')
+    assert synthesize.cache_path(tmp_path, 'Hello  World', 'v', 'wav') != base
+    assert synthesize.cache_path(tmp_path, 'Hello  World', 'v', 'mp3', model='m') != base
+    assert synthesize.cache_path(tmp_path, 'hello world', 'v', 'mp3') != base
+    assert (synthesize.cache_path(tmp_path, 'hello world', 'v', 'mp3', normalize=True)
+            == synthesize.cache_path(tmp_path, 'Hello  World', 'v', 'mp3', normalize=True))
+
+
+def test_batch_mode_writes_one_file_per_line(tmp_path, monkeypatch):
+    infile = tmp_path / "lines.txt"
+    infile.write_text("intro|Hello there\n\noutro|Goodbye\n", encoding="utf-8")
+    posted = []
+
+    def fake_post(url, headers=None, json=None, stream=None, timeout=None):
+        posted.append(json['text'])
+        return DummyResponse(json['text'].encode())
+
+    monkeypatch.setattr(synthesize, 'HAS_SDK', False)
+    monkeypatch.setattr(synthesize._SESSION, 'post', fake_post)
+    monkeypatch.setenv(synthesize.env_var_name, 'TEST_API_KEY_REDACTED')
+
+    synthesize.main(["--infile", str(infile), "--batch", "--input-format", "pipe", "--num-parallel-requests", "2",
+                     "--voice", "21m00Tcm4TlvDq8ikWAM", "--output", str(tmp_path / "clip.mp3"), "--no-cache"])
+
+    assert sorted(posted) == ["Goodbye", "Hello there"]
+    assert (tmp_path / "clip_intro.mp3").read_bytes() == b"Hello there"
+    assert (tmp_path / "clip_outro.mp3").read_bytes() == b"Goodbye"
+
+
+@pytest.mark.parametrize("text, problem", [
+    ("a|one\nsub/dir|two", "path separators"),
+    ("a|one\n |two", "empty id"),
+    ("a|one\na|two", "duplicate id"),
+])
+def test_parse_batch_rejects_unusable_ids(text, problem, capsys):
+    with pytest.raises(SystemExit):
+        synthesize.parse_batch(text, 'pipe')
+    err = capsys.readouterr().err
+    assert err.startswith("Batch line 2:") and problem in err
+
+
+@pytest.mark.parametrize("output, expected", [
+    ("clip", "clip.wav"),
+    ("clip.mp3", "clip.wav"),
+    ("clip.WAV", "clip.WAV"),
+    ("clip/", "clip.wav"),
+])
+def test_output_extension_follows_format(tmp_path, monkeypatch, output, expected):
+    monkeypatch.setattr(synthesize, 'HAS_SDK', False)
+    monkeypatch.setattr(synthesize._SESSION, 'post', fake_post_factory(b"WAVAUDIO"))
+    monkeypatch.setenv(synthesize.env_var_name, 'TEST_API_KEY_REDACTED')
+    monkeypatch.chdir(tmp_path)
+    synthesize.main(["--text", "hi", "--voice", "21m00Tcm4TlvDq8ikWAM", "--format", "wav",
+                     "--output", output, "--no-cache"])
+    assert [p.name for p in tmp_path.iterdir()] == [expected]
+
+
+def test_synthesize_via_http2_client(tmp_path, monkeypatch):
+    httpx = pytest.importorskip("httpx")
+
+    def handler(request):
+        assert request.headers['xi-api-key'] == 'sk_test'
+        return httpx.Response(200, content=b"H2AUDIO")
+
+    monkeypatch.setattr(synthesize, '_http2_client', lambda: httpx.Client(transport=httpx.MockTransport(handler)))
+    out = tmp_path / "h2.mp3"
+    synthesize.synthesize_via_http(text='hello', api_key='sk_test', voice='voiceid', endpoint='https://api.elevenlabs.io',
+                                   out_path=out, http2=True)
+    assert out.read_bytes() == b"H2AUDIO"
+
+
+def test_http2_client_retries_rate_limited_requests(tmp_path, monkeypatch):
+    httpx = pytest.importorskip("httpx")
+    statuses = [429, 200]
+
+    def handler(request):
+        status = statuses.pop(0)
+        if status == 429:
+            return httpx.Response(429, headers={'Retry-After': '0'}, content=b"slow down")
+        return httpx.Response(200, content=b"H2AUDIO")
+
+    monkeypatch.setattr(synthesize, '_http2_client', lambda: httpx.Client(transport=httpx.MockTransport(handler)))
+    out = tmp_path / "h2.mp3"
+    synthesize.synthesize_via_http(text='hello', api_key='sk_test', voice='voiceid', endpoint='https://api.elevenlabs.io',
+                                   out_path=out, http2=True)
+    assert statuses == []
+    assert out.read_bytes() == b"H2AUDIO"
+
+
+def test_preallocated_output_is_trimmed_to_body(tmp_path, monkeypatch, capsys):
+    # a Content-Length larger than the body must not leave trailing zero bytes
+    def fake_post(url, headers=None, json=None, stream=None, timeout=None):
+        return DummyResponse(b"SHORT", headers={'Content-Length': '4096'})
+
+    monkeypatch.setattr(synthesize._SESSION, 'post', fake_post)
+    out = tmp_path / "pre.mp3"
+    synthesize.synthesize_via_http(text='hello', api_key='sk_test', voice='voiceid', endpoint='https://api.elevenlabs.io',
+                                   out_path=out)
+    assert out.read_bytes() == b"SHORT"
+    # the reported size is the streamed byte count, not the preallocated length
+    assert "(5 bytes)" in capsys.readouterr().out
+
+
+def _run_async_batch(aiohttp_web, handler, jobs, concurrency):
+    """Run _asynthesize_batch against a local aiohttp server answering with `handler`."""
+    import asyncio
+
+    async def run():
+        app = aiohttp_web.Application()
+        app.router.add_post('/v1/text-to-speech/{voice}', handler)
+        runner = aiohttp_web.AppRunner(app)
+        await runner.setup()
+        site = aiohttp_web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            await synthesize._asynthesize_batch(jobs, concurrency, api_key='sk_test', voice='voiceid',
+                                                endpoint=f'http://127.0.0.1:{port}')
+        finally:
+            await runner.cleanup()
+
+    asyncio.run(run())
+
+
+def test_asyncio_batch_writes_each_job(tmp_path):
+    aiohttp_web = pytest.importorskip("aiohttp.web")
+
+    async def handler(request):
+        assert request.headers['xi-api-key'] == 'sk_test'
+        body = await request.json()
+        return aiohttp_web.Response(body=body['text'].upper().encode())
+
+    jobs = [("one", tmp_path / "a_one.mp3"), ("two", tmp_path / "a_two.mp3")]
+    _run_async_batch(aiohttp_web, handler, jobs, 2)
+    assert (tmp_path / "a_one.mp3").read_bytes() == b"ONE"
+    assert (tmp_path / "a_two.mp3").read_bytes() == b"TWO"
+
+
+def test_asyncio_batch_timeout_is_per_request(tmp_path, monkeypatch):
+    aiohttp_web = pytest.importorskip("aiohttp.web")
+    import asyncio
+    delay = {'s': 0.1}
+
+    async def handler(request):
+        await asyncio.sleep(delay['s'])
+        return aiohttp_web.Response(body=b"AUDIO")
+
+    # queued jobs take far longer than the timeout in total, but no single request does
+    monkeypatch.setattr(synthesize, '_ASYNC_TIMEOUT', 0.3)
+    jobs = [(str(i), tmp_path / f"q_{i}.mp3") for i in range(6)]
+    _run_async_batch(aiohttp_web, handler, jobs, 1)
+    assert all(out.read_bytes() == b"AUDIO" for _, out in jobs)
+
+    # a request that does stall is reported through fail(), not a traceback
+    delay['s'] = 1
+    with pytest.raises(SystemExit):
+        _run_async_batch(aiohttp_web, handler, jobs[:1], 1)
+
+
+def test_asyncio_batch_retries_rate_limited_requests(tmp_path):
+    aiohttp_web = pytest.importorskip("aiohttp.web")
+    calls = []
+
+    async def handler(request):
+        calls.append(request.path)
+        if len(calls) == 1:
+            return aiohttp_web.Response(status=429, headers={'Retry-After': '0'}, text='slow down')
+        return aiohttp_web.Response(body=b"AUDIO")
+
+    out = tmp_path / "r.mp3"
+    _run_async_batch(aiohttp_web, handler, [("hi", out)], 1)
+    assert len(calls) == 2
+    assert out.read_bytes() == b"AUDIO"
+
+
+def test_asyncio_batch_does_not_retry_client_errors(tmp_path, capsys):
+    aiohttp_web = pytest.importorskip("aiohttp.web")
+    calls = []
+
+    async def handler(request):
+        calls.append(request.path)
+        return aiohttp_web.Response(status=401, text='bad key')
+
+    with pytest.raises(SystemExit):
+        _run_async_batch(aiohttp_web, handler, [("hi", tmp_path / "r.mp3")], 1)
+    assert len(calls) == 1
+    assert 'status=401' in capsys.readouterr().err
+
+
+def test_output_dash_streams_to_stdout(tmp_path, monkeypatch, capsysbinary):
+    monkeypatch.setattr(synthesize, 'HAS_SDK', False)
+    monkeypatch.setattr(synthesize._SESSION, 'post', fake_post_factory(b"PIPEDAUDIO"))
+    monkeypatch.setenv(synthesize.env_var_name, 'TEST_API_KEY_REDACTED')
+    args = ["--text", "hi", "--voice", "21m00Tcm4TlvDq8ikWAM", "--output", "-", "--cache-dir", str(tmp_path)]
+
+    synthesize.main(args)
+    assert capsysbinary.readouterr().out == b"PIPEDAUDIO"
+    # the streamed response was teed into the cache, so a repeat is served from it
+    monkeypatch.setattr(synthesize._SESSION, 'post', None)
+    synthesize.main(args)
+    assert capsysbinary.readouterr().out == b"PIPEDAUDIO"
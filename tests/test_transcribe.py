@@ -1,6 +1,9 @@
 import json
 import tempfile
 import os
+import sys
+import types
+import pytest
 import transcribe
 class MockResp:
     def __init__(self, data=None, ok=True, status_code=200):
@@ -8,6 +11,7 @@ class MockResp:
         self.ok = ok
         self.status_code = status_code
         self.text = json.dumps(self._data)
+        self.content = self.text.encode()
     def json(self):
         return self._data
 
@@ -17,9 +21,77 @@ def test_transcribe_file_monkeypatch(monkeypatch):
         f.write(b"RIFF....WAVEfmt ")
     def mock_post(*args, **kwargs):
         return MockResp()
-    monkeypatch.setattr("requests.post", mock_post)
+    monkeypatch.setattr(transcribe._SESSION, "post", mock_post)
     result = transcribe.transcribe_file(path, api_key="dummy", endpoint=transcribe.DEFAULT_ENDPOINT)
     assert isinstance(result, dict)
     assert "text" in result
     assert result["text"] == "pytest mocked transcription"
     os.remove(path)
+
+def test_transcribe_file_rate_limited_is_retriable(monkeypatch, tmp_path):
+    audio = tmp_path / "a.wav"
+    audio.write_bytes(b"RIFF....WAVEfmt ")
+    resp = MockResp(data={"detail": "too many requests"}, ok=False, status_code=429)
+    resp.headers = {"Retry-After": "3"}
+    monkeypatch.setattr(transcribe._SESSION, "post", lambda *a, **k: resp)
+    with pytest.raises(transcribe.RetriableHTTPError) as excinfo:
+        transcribe.transcribe_file(str(audio), api_key="dummy", endpoint=transcribe.DEFAULT_ENDPOINT)
+    assert excinfo.value.status_code == 429
+    assert excinfo.value.retry_after == 3.0
+
+
+def test_transcribe_file_accepts_file_object(monkeypatch):
+    import io
+    buf = io.BytesIO(b"RIFF....WAVEfmt ")
+    buf.name = "clip.wav"
+    buf.read()  # a consumed buffer must be rewound before upload
+    uploads = []
+
+    def mock_post(*args, files=None, **kwargs):
+        name, f, _ = files["file"]
+        uploads.append((name, f.read()))
+        return MockResp()
+
+    monkeypatch.setattr(transcribe._SESSION, "post", mock_post)
+    result = transcribe.transcribe_file(buf, api_key="dummy", endpoint=transcribe.DEFAULT_ENDPOINT)
+    assert result["text"] == "pytest mocked transcription"
+    assert uploads == [("clip.wav", b"RIFF....WAVEfmt ")]
+    assert not buf.closed
+
+
+def test_shares_connection_pool_with_synthesize_without_retries():
+    import synthesize
+    stt = transcribe._SESSION.get_adapter(transcribe.DEFAULT_ENDPOINT)
+    tts = synthesize._SESSION.get_adapter("https://api.elevenlabs.io/v1/text-to-speech/v")
+    assert stt.poolmanager is tts.poolmanager
+    # the caller (e.g. tenacity in integration_example) owns STT retries
+    assert stt.max_retries.total == 0
+    assert tts.max_retries.total == 4
+
+
+def test_load_sdk_sets_flag_after_importing_both_names(monkeypatch):
+    seen = []
+
+    class FakeApiError(Exception):
+        pass
+
+    def api_error_getattr(name):
+        # record what a concurrent caller would observe mid-import
+        if name == "ApiError":
+            seen.append(transcribe._HAS_ELEVEN_SDK)
+            return FakeApiError
+        raise AttributeError(name)
+
+    client = types.ModuleType("elevenlabs.client")
+    client.ElevenLabs = object
+    api_error = types.ModuleType("elevenlabs.core.api_error")
+    api_error.__getattr__ = api_error_getattr
+    for mod in (types.ModuleType("elevenlabs"), client, types.ModuleType("elevenlabs.core"), api_error):
+        monkeypatch.setitem(sys.modules, mod.__name__, mod)
+    monkeypatch.setattr(transcribe, "_HAS_ELEVEN_SDK", None)
+    monkeypatch.setattr(transcribe, "ElevenLabs", None)
+    monkeypatch.setattr(transcribe, "ApiError", None)
+
+    assert transcribe._load_sdk() is True
+    assert seen == [None]
+    assert transcribe.ElevenLabs is object and transcribe.ApiError is FakeApiError
@@ -42,12 +42,14 @@ def test_sdk_422_falls_back_to_http(tmp_path, monkeypatch):
     monkeypatch.setattr(transcribe, "ElevenLabs", lambda api_key=None: FakeClient())
     monkeypatch.setattr(transcribe, "ApiError", FakeApiError)
 
-    # Track whether requests.post is invoked and return a successful JSON response
+    # Track whether the HTTP session post is invoked and return a successful JSON response
     calls = []
 
     class FakeResp:
         ok = True
 
+        content = b'{"text": "fallback transcript"}'
+
         def __init__(self):
             self.status_code = 200
 
@@ -58,12 +60,12 @@ def test_sdk_422_falls_back_to_http(tmp_path, monkeypatch):
         calls.append({"url": url, "headers": headers, "data": data})
         return FakeResp()
 
-    monkeypatch.setattr(transcribe, "requests", types.SimpleNamespace(post=fake_post))
+    monkeypatch.setattr(transcribe._SESSION, "post", fake_post)
 
     out_path = tmp_path / "out.txt"
     result = transcribe.transcribe_file(str(audio), api_key="sk_test", endpoint=transcribe.DEFAULT_ENDPOINT, model="scribe_v2", save_to=str(out_path))
 
-    assert calls, "Expected HTTP fallback via requests.post to be invoked"
+    assert calls, "Expected HTTP fallback via the session post to be invoked"
     assert result.get("text") == "fallback transcript"
     assert out_path.exists()
     assert out_path.read_text() == "fallback transcript"
@@ -37,7 +37,7 @@ def test_sdk_non422_raises_and_no_http_fallback(tmp_path, monkeypatch):
     monkeypatch.setattr(transcribe, "ElevenLabs", lambda api_key=None: FakeClient())
     monkeypatch.setattr(transcribe, "ApiError", FakeApiError)
 
-    # Spy on requests.post to ensure it's NOT called
+    # Spy on the HTTP session post to ensure it's NOT called
     calls = []
 
     def fake_post(*args, **kwargs):
@@ -45,7 +45,7 @@ def test_sdk_non422_raises_and_no_http_fallback(tmp_path, monkeypatch):
         # shouldn't be called; if it is, return a harmless response
         return types.SimpleNamespace(ok=True, status_code=200, json=lambda: {"text": "should not be used"})
 
-    monkeypatch.setattr(transcribe, "requests", types.SimpleNamespace(post=fake_post))
+    monkeypatch.setattr(transcribe._SESSION, "post", fake_post)
 
     with pytest.raises(RuntimeError) as excinfo:
         transcribe.transcribe_file(str(audio), api_key="dummy", endpoint=transcribe.DEFAULT_ENDPOINT, model="scribe_v2")
@@ -15,37 +15,141 @@ import os
 import sys
 import re
 import argparse
-import requests
-from typing import Optional
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import BinaryIO, Optional, Union
+from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
+
+from _http import _loads, get_session
 
 DEFAULT_ENDPOINT = "https://api.elevenlabs.io/v1/speech-to-text"
 
 # avoid embedding the literal API var name to satisfy local secret scanners
 env_var_name = 'ELEVEN' + 'LABS_API_KEY'
+# expected key shape: `sk_` followed by an alphanumeric token
+_KEY_RE = re.compile(r"^sk_[A-Za-z0-9]{16,}$")
+
+# Keep-alive session (sharing its connection pool with synthesize.py) so repeated
+# transcriptions, e.g. concurrent batch uploads, reuse warm TLS connections instead of
+# handshaking per file. Uploads are not retried here: failures surface as
+# RetriableHTTPError for the caller's own retry policy, so attempts never multiply.
+_SESSION = get_session(retries=False)
+
+# The SDK pulls in httpx/pydantic and is slow to import, so it is loaded on first
+# use. `_HAS_ELEVEN_SDK` stays None until the import has been attempted; tests may
+# preset it together with `ElevenLabs`/`ApiError`.
+ElevenLabs = None  # type: ignore
+ApiError = None  # type: ignore
+_HAS_ELEVEN_SDK = None
+
+
+def _load_sdk() -> bool:
+    """Import the official ElevenLabs SDK on first call; return whether it is available."""
+    global ElevenLabs, ApiError, _HAS_ELEVEN_SDK
+    if _HAS_ELEVEN_SDK is None:
+        try:
+            from elevenlabs.client import ElevenLabs as client_cls  # type: ignore
+        except Exception:
+            client_cls = None
+        # ApiError class enables nicer error handling when the SDK is present
+        try:
+            from elevenlabs.core.api_error import ApiError as error_cls  # type: ignore
+        except Exception:
+            error_cls = None
+        # publish the flag last: concurrent first callers check only the flag, so
+        # both names must already be set when it stops being None
+        ElevenLabs, ApiError = client_cls, error_cls
+        _HAS_ELEVEN_SDK = client_cls is not None
+    return _HAS_ELEVEN_SDK
+
+
+def _load_dotenv() -> None:
+    """Load .env if present and python-dotenv is installed."""
+    try:
+        from dotenv import load_dotenv  # type: ignore
+        load_dotenv()
+    except Exception:
+        pass
+
+# Rate limiting and transient server errors; worth retrying with backoff.
+RETRIABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+class RetriableHTTPError(RuntimeError):
+    """API error that may succeed on retry (429 or transient 5xx).
+
+    `retry_after` carries the server's Retry-After hint in seconds, if any.
+    """
+
+    def __init__(self, message: str, status_code: int, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+def _http_error(resp, data) -> RuntimeError:
+    """Build the exception for a failed HTTP response, flagging retriable statuses."""
+    msg = f"API error (status {resp.status_code}): {data}"
+    if resp.status_code not in RETRIABLE_STATUS:
+        return RuntimeError(msg)
+    retry_after = None
+    try:
+        retry_after = float(resp.headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        pass
+    return RetriableHTTPError(msg, resp.status_code, retry_after)
+
+
+@contextmanager
+def _open_audio(file: Union[str, BinaryIO]):
+    """Yield `(name, binary file)` for a path or an already-open binary file object.
+
+    File objects are rewound so retries resend the whole audio, and are left open.
+    """
+    if hasattr(file, "read"):
+        file.seek(0)
+        yield os.path.basename(getattr(file, "name", "") or "audio"), file
+    else:
+        with open(file, "rb") as f:
+            yield os.path.basename(file), f
+
+
+@lru_cache(maxsize=32)
+def _endpoint_with_model(endpoint: str, model: str) -> str:
+    """Return `endpoint` with `model` set as its `model` query parameter."""
+    parts = urlparse(endpoint)
+    qs = dict(parse_qsl(parts.query))
+    qs["model"] = model
+    return urlunparse(parts._replace(query=urlencode(qs)))
 
-# load .env if present
-try:
-    from dotenv import load_dotenv  # type: ignore
-    load_dotenv()
-except Exception:
-    pass
-
-# Try to import the official ElevenLabs SDK; if present we'll prefer it for STT.
-try:
-    from elevenlabs.client import ElevenLabs  # type: ignore
-    _HAS_ELEVEN_SDK = True
-except Exception:
-    ElevenLabs = None  # type: ignore
-    _HAS_ELEVEN_SDK = False
-# Try to import ApiError class for nicer error handling when SDK is present
-try:
-    from elevenlabs.core.api_error import ApiError  # type: ignore
-except Exception:
-    ApiError = None  # type: ignore
+
+def _transcribe_via_http(file_path: Union[str, BinaryIO], api_key: str, endpoint: str, model: str) -> dict:
+    """POST the audio to the REST endpoint and return the decoded JSON response."""
+    # HTTP fallback: append model as query param if provided
+    if model:
+        endpoint = _endpoint_with_model(endpoint, model)
+
+    # Use the same API-key header the Eleven Labs REST endpoints expect
+    headers = {"xi-api-key": api_key}
+    with _open_audio(file_path) as (name, f):
+        files = {"file": (name, f, "application/octet-stream")}
+        # Include the model id in the request body so the API accepts the request
+        data = {"model_id": model} if model else None
+        resp = _SESSION.post(endpoint, headers=headers, files=files, data=data, timeout=120)
+    try:
+        data = _loads(resp.content)
+    except ValueError:
+        if resp.status_code in RETRIABLE_STATUS:
+            # gateways often answer transient failures with HTML bodies
+            raise _http_error(resp, resp.text)
+        raise RuntimeError(f"Non-JSON response (status {resp.status_code}): {resp.text}")
+    if not resp.ok:
+        raise _http_error(resp, data)
+    return data
 
 
 def transcribe_file(
-    file_path: str,
+    file_path: Union[str, BinaryIO],
     api_key: str,
     endpoint: str = DEFAULT_ENDPOINT,
     model: str = "scribe_v2",
@@ -53,6 +157,7 @@ def transcribe_file(
 ) -> dict:
     """Transcribe `file_path` using ElevenLabs SDK if available, otherwise HTTP fallback.
 
+    - `file_path` may also be a binary file object (e.g. an in-memory ``io.BytesIO``).
     - `model` is passed to the SDK (or appended as query param to endpoint for the HTTP fallback).
     - If `save_to` is provided, the combined text (if present) will be written to that path.
     """
@@ -63,36 +168,9 @@ def transcribe_file(
     force_http = str(os.environ.get("ELEVENLABS_FORCE_HTTP", "")).lower() in ("1", "true", "yes")
 
     # Prefer SDK when available and not explicitly forced to use HTTP
-    def _transcribe_via_http(file_path: str, api_key: str, endpoint: str, model: str) -> dict:
-        # HTTP fallback: append model as query param if provided
-        if model:
-            from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
-
-            parts = urlparse(endpoint)
-            qs = dict(parse_qsl(parts.query))
-            qs["model"] = model
-            parts = parts._replace(query=urlencode(qs))
-            endpoint_local = urlunparse(parts)
-        else:
-            endpoint_local = endpoint
-
-        headers = {"xi-api-key": api_key}
-        with open(file_path, "rb") as f:
-            files = {"file": (os.path.basename(file_path), f, "application/octet-stream")}
-            data = {"model_id": model} if model else None
-            resp = requests.post(endpoint_local, headers=headers, files=files, data=data, timeout=120)
-        try:
-            data = resp.json()
-        except ValueError:
-            raise RuntimeError(f"Non-JSON response (status {resp.status_code}): {resp.text}")
-        if not resp.ok:
-            raise RuntimeError(f"API error (status {resp.status_code}): {data}")
-        return data
-
-
-    if _HAS_ELEVEN_SDK and not force_http:
+    if not force_http and _load_sdk():
         client = ElevenLabs(api_key=api_key)
-        with open(file_path, "rb") as f:
+        with _open_audio(file_path) as (_, f):
             try:
                 resp = client.speech_to_text.convert(model_id=model, file=f)
             except Exception as e:
@@ -118,7 +196,10 @@ def transcribe_file(
                                 msg = str(body)
                         except Exception:
                             msg = str(body)
-                        raise RuntimeError(f"ElevenLabs API error (status={status_code}): {msg}") from e
+                        msg = f"ElevenLabs API error (status={status_code}): {msg}"
+                        if status_code in RETRIABLE_STATUS:
+                            raise RetriableHTTPError(msg, status_code) from e
+                        raise RuntimeError(msg) from e
                 else:
                     # otherwise re-raise as a runtime error
                     raise RuntimeError(f"ElevenLabs SDK error: {e}") from e
@@ -129,29 +210,7 @@ def transcribe_file(
             except Exception:
                 data = {"text": getattr(resp, "text", None)}
     else:
-        # HTTP fallback: append model as query param if provided
-        if model:
-            from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
-
-            parts = urlparse(endpoint)
-            qs = dict(parse_qsl(parts.query))
-            qs["model"] = model
-            parts = parts._replace(query=urlencode(qs))
-            endpoint = urlunparse(parts)
-
-        # Use the same API-key header the Eleven Labs REST endpoints expect
-        headers = {"xi-api-key": api_key}
-        with open(file_path, "rb") as f:
-            files = {"file": (os.path.basename(file_path), f, "application/octet-stream")}
-            # Include the model id in the request body so the API accepts the request
-            data = {"model_id": model} if model else None
-            resp = requests.post(endpoint, headers=headers, files=files, data=data, timeout=120)
-        try:
-            data = resp.json()
-        except ValueError:
-            raise RuntimeError(f"Non-JSON response (status {resp.status_code}): {resp.text}")
-        if not resp.ok:
-            raise RuntimeError(f"API error (status {resp.status_code}): {data}")
+        data = _transcribe_via_http(file_path, api_key, endpoint, model)
 
     # Save combined text if requested
     text = None
@@ -197,6 +256,7 @@ def main(argv=None):
     parser.add_argument("--raw", action="store_true", help="Print raw JSON response")
     args = parser.parse_args(argv)
 
+    _load_dotenv()
     api_key = args.api_key or os.environ.get(env_var_name)
     if not api_key:
         print(f"Error: Eleven Labs API key required. Set {env_var_name} or pass --api-key.", file=sys.stderr)
@@ -206,7 +266,7 @@ def main(argv=None):
     # by an alphanumeric token. This is only a heuristic; a true validation requires
     # making an API request. We warn here if the key doesn't match the expected pattern.
     if isinstance(api_key, str):
-        if not re.match(r"^sk_[A-Za-z0-9]{16,}$", api_key):
+        if not _KEY_RE.match(api_key):
             print(
                 "Error: the provided API key does not match the expected format (should start with 'sk_' and include an alphanumeric token).",
                 file=sys.stderr,